@@ -5,41 +5,86 @@ Story 3.4: Global Safety Switch
 
 This module provides REST API endpoints for:
 - GET /api/safety/status - Get current system status
+- GET /api/safety/status/stream - Server-Sent Events feed of system status
 - POST /api/safety/pause - Pause trading (kill switch)
 - POST /api/safety/resume - Resume trading after pause
 - POST /api/safety/liquidate - Emergency liquidation (DANGER!)
+- GET /api/safety/portfolio - Portfolio breakdown (JSON or NDJSON)
 
 SECURITY NOTE: These endpoints should be protected with authentication
 in production. The /liquidate endpoint is particularly dangerous and
 should require additional confirmation.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+import time
+from contextlib import contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Set, Tuple
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 from services.safety import (
     get_system_status,
-    get_system_config,
-    is_trading_enabled,
+    get_safety_snapshot,
     pause_trading,
     resume_trading,
-    check_drawdown,
     get_portfolio_value,
-    get_open_positions_value,
+    iter_portfolio_value,
     liquidate_all,
+    liquidate_all_stream,
     initialize_system_config,
 )
 from models import SystemStatus
 
+# Optional: MessagePack wire format for the portfolio stream
+try:
+    import ormsgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 # Configure logging
 logger = logging.getLogger("safety_api")
 
 # Create router
 router = APIRouter(prefix="/api/safety", tags=["safety"])
 
+# Short-lived cache for GET /status. Dashboards poll this endpoint every
+# few seconds, and each miss hits the database and Kraken. Mutating
+# endpoints invalidate the cache so state changes show up immediately.
+# The serialized JSON body and its ETag are cached, so hits skip
+# serialization too.
+STATUS_CACHE_TTL_SECONDS = 2.0
+_status_cache: Optional[Tuple[float, bytes, str]] = None
+
+# Wakes /status/stream subscribers when safety state changes
+_status_changed = asyncio.Event()
+
+# Strong references to running streamed liquidations (see _start_liquidation)
+_liquidation_tasks: Set[asyncio.Task] = set()
+
+# One lock per mutating safety action (see _exclusive)
+_action_locks: Dict[str, asyncio.Lock] = {}
+
+
+def invalidate_status_cache() -> None:
+    """
+    Drop the cached /status response so the next poll recomputes it.
+
+    Also notifies /status/stream subscribers so they push the new state
+    without waiting for their next interval.
+    """
+    global _status_cache
+    _status_cache = None
+    # set() wakes every current waiter; clear() re-arms for the next change
+    _status_changed.set()
+    _status_changed.clear()
+
 
 # =============================================================================
 # Response Models
@@ -48,6 +93,8 @@ router = APIRouter(prefix="/api/safety", tags=["safety"])
 
 class SystemStatusResponse(BaseModel):
     """Response model for system status."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
     trading_enabled: bool
     current_value: float
@@ -59,17 +106,23 @@ class SystemStatusResponse(BaseModel):
 
 class PauseResponse(BaseModel):
     """Response model for pause action."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
     reason: str
 
 
 class ResumeResponse(BaseModel):
     """Response model for resume action."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
 
 
 class LiquidationResponse(BaseModel):
     """Response model for liquidation action."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     positions_closed: int
     positions_failed: int
     total_pnl: float
@@ -77,26 +130,127 @@ class LiquidationResponse(BaseModel):
     timestamp: str
 
 
+class PortfolioHolding(BaseModel):
+    """A single currency balance in the portfolio breakdown."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    amount: float
+    value_usd: float
+
+
+class PortfolioResponse(BaseModel):
+    """Response model for portfolio breakdown."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    total_value_usd: float
+    breakdown: Dict[str, PortfolioHolding]
+
+
 class InitConfigRequest(BaseModel):
     """Request model for initializing system config."""
+    model_config = ConfigDict(extra="forbid")
+
     initial_balance: float
     max_drawdown_pct: float = 0.20
 
 
 class InitConfigResponse(BaseModel):
     """Response model for system config initialization."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
     initial_balance: float
     max_drawdown_pct: float
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+async def _load_status() -> Tuple[bytes, str]:
+    """
+    Build the current system status as JSON, served from cache within the TTL.
+
+    The body is serialized straight from the service snapshot; its shape is
+    SystemStatusResponse, which documents it in the OpenAPI schema.
+
+    Returns:
+        Tuple of (JSON-encoded SystemStatusResponse body, quoted ETag)
+    """
+    global _status_cache
+
+    now = time.monotonic()
+    if _status_cache is not None and now - _status_cache[0] < STATUS_CACHE_TTL_SECONDS:
+        return _status_cache[1], _status_cache[2]
+
+    snapshot = await get_safety_snapshot()
+    body = orjson.dumps({**snapshot, "status": snapshot["status"].value})
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+    _status_cache = (now, body, etag)
+    return body, etag
+
+
+def _exclusive(action: str) -> Callable[[], AsyncIterator[None]]:
+    """
+    Build a dependency that rejects overlapping requests for an action.
+
+    A second request arriving while the first is still running gets 429
+    instead of racing it against the database and the exchange.
+
+    Args:
+        action: Name of the guarded action (e.g. "liquidate")
+    """
+    async def dependency() -> AsyncIterator[None]:
+        lock = _action_locks.setdefault(action, asyncio.Lock())
+        # No await between the check and acquiring, so this is atomic
+        if lock.locked():
+            raise HTTPException(
+                status_code=429,
+                detail=f"A {action} request is already in progress",
+            )
+        async with lock:
+            yield
+
+    return dependency
+
+
+@contextmanager
+def _http_500(detail_prefix: str) -> Iterator[None]:
+    """
+    Report unexpected errors in an endpoint body as a 500 HTTPException.
+
+    Raising inside the route keeps the error response within
+    CORSMiddleware, so the dashboard can read it. HTTPExceptions raised
+    deliberately pass through unchanged.
+
+    Args:
+        detail_prefix: Start of the error detail (e.g. "Failed to pause trading")
+    """
+    try:
+        yield
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("%s: %s", detail_prefix, e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"{detail_prefix}: {str(e)}"
+        )
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
 
 
-@router.get("/status", response_model=SystemStatusResponse)
-async def get_status():
+@router.get(
+    "/status",
+    response_model=None,
+    responses={200: {"model": SystemStatusResponse}},
+)
+async def get_status(request: Request) -> Response:
     """
     Get current system status.
 
@@ -106,40 +260,73 @@ async def get_status():
     - Current portfolio value
     - Current drawdown percentage
     - Number of open positions
-    """
-    try:
-        status = await get_system_status()
-        config = await get_system_config()
-        trading_enabled = await is_trading_enabled()
-
-        # Get drawdown info
-        _, drawdown_pct, current_value = await check_drawdown()
-
-        # Get open positions count
-        _, position_count = await get_open_positions_value()
-
-        initial_balance = float(config.initial_balance) if config else 0.0
-        max_drawdown_pct = float(config.max_drawdown_pct) if config else 0.20
-
-        return SystemStatusResponse(
-            status=status.value,
-            trading_enabled=trading_enabled,
-            current_value=current_value,
-            initial_balance=initial_balance,
-            drawdown_pct=drawdown_pct,
-            max_drawdown_pct=max_drawdown_pct,
-            open_positions=position_count,
-        )
 
-    except Exception as e:
-        logger.error(f"Failed to get system status: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get system status: {str(e)}"
-        )
+    Responses are cached for STATUS_CACHE_TTL_SECONDS. The body is built
+    from typed service data, so it skips response_model re-validation.
+
+    Responses carry an ETag; clients sending a matching If-None-Match
+    get an empty 304 Not Modified instead of the body.
+    """
+    with _http_500("Failed to get system status"):
+        body, etag = await _load_status()
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+@router.get("/status/stream")
+async def stream_status(
+    request: Request,
+    interval: float = Query(
+        default=5.0, ge=1.0, le=60.0,
+        description="Seconds between updates when nothing changes",
+    ),
+):
+    """
+    Stream system status as Server-Sent Events.
 
+    Pushes the current status immediately, then again whenever safety
+    state changes (pause/resume/liquidate/init) or every `interval`
+    seconds. Dashboards should use this via EventSource instead of
+    polling GET /status.
 
-@router.post("/pause", response_model=PauseResponse)
+    Args:
+        interval: Seconds between updates when nothing changes
+    """
+    async def event_generator():
+        while not await request.is_disconnected():
+            try:
+                body, _ = await _load_status()
+                yield b"data: " + body + b"\n\n"
+            except Exception as e:
+                logger.error("Failed to get system status for stream: %s", e)
+                error = orjson.dumps({"detail": f"Failed to get system status: {str(e)}"})
+                yield b"event: error\ndata: " + error + b"\n\n"
+
+            try:
+                await asyncio.wait_for(_status_changed.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/pause",
+    response_model=PauseResponse,
+    dependencies=[Depends(_exclusive("pause"))],
+)
 async def pause_system(
     reason: str = Query(default="Manual pause", description="Reason for pausing")
 ):
@@ -155,30 +342,22 @@ async def pause_system(
     Args:
         reason: Reason for pausing (logged for audit trail)
     """
-    try:
+    with _http_500("Failed to pause trading"):
         success = await pause_trading(reason)
+        invalidate_status_cache()
         if not success:
             raise HTTPException(
                 status_code=500,
                 detail="Failed to pause trading"
             )
 
-        logger.warning(f"Trading PAUSED via API: {reason}")
+        logger.warning("Trading PAUSED via API: %s", reason)
 
         return PauseResponse(
             status="paused",
             reason=reason,
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to pause trading: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to pause trading: {str(e)}"
-        )
-
 
 @router.post("/resume", response_model=ResumeResponse)
 async def resume_system():
@@ -190,8 +369,9 @@ async def resume_system():
     NOTE: Cannot resume from EMERGENCY_STOP status.
     EMERGENCY_STOP requires manual database intervention to clear.
     """
-    try:
+    with _http_500("Failed to resume trading"):
         success = await resume_trading()
+        invalidate_status_cache()
         if not success:
             # Check if it's because we're in EMERGENCY_STOP
             status = await get_system_status()
@@ -212,20 +392,16 @@ async def resume_system():
 
         return ResumeResponse(status="active")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to resume trading: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to resume trading: {str(e)}"
-        )
-
 
-@router.post("/liquidate", response_model=LiquidationResponse)
+@router.post(
+    "/liquidate",
+    response_model=LiquidationResponse,
+    dependencies=[Depends(_exclusive("liquidate"))],
+)
 async def emergency_liquidate(
     reason: str = Query(default="Manual emergency", description="Reason for liquidation"),
     confirm: bool = Query(default=False, description="Confirm liquidation"),
+    stream: bool = Query(default=False, description="Stream progress as Server-Sent Events"),
 ):
     """
     DANGER: Liquidate all positions immediately.
@@ -237,9 +413,14 @@ async def emergency_liquidate(
 
     WARNING: This should only be used in emergency situations.
 
+    With stream=true the response is a Server-Sent Events feed with one
+    event per position (closed/failed) and a final "complete" event
+    carrying the same summary as the non-streaming response.
+
     Args:
         reason: Reason for liquidation (logged for audit trail)
         confirm: Must be True to confirm the action
+        stream: Stream per-position progress instead of blocking
     """
     if not confirm:
         raise HTTPException(
@@ -251,10 +432,30 @@ async def emergency_liquidate(
             )
         )
 
-    try:
-        logger.critical(f"EMERGENCY LIQUIDATION triggered via API: {reason}")
+    # A streamed liquidation keeps running after its request returns
+    if _liquidation_tasks:
+        raise HTTPException(
+            status_code=429,
+            detail="A liquidate request is already in progress",
+        )
+
+    if stream:
+        logger.critical("EMERGENCY LIQUIDATION (streaming) triggered via API: %s", reason)
+        # Register the task before responding so a second request is refused
+        queue = _start_liquidation(reason)
+        return StreamingResponse(
+            _liquidation_events(queue),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    logger.critical("EMERGENCY LIQUIDATION triggered via API: %s", reason)
 
-        summary = await liquidate_all(reason=reason)
+    with _http_500("Liquidation failed"):
+        try:
+            summary = await liquidate_all(reason=reason)
+        finally:
+            invalidate_status_cache()
 
         return LiquidationResponse(
             positions_closed=summary["positions_closed"],
@@ -264,12 +465,46 @@ async def emergency_liquidate(
             timestamp=summary["timestamp"],
         )
 
-    except Exception as e:
-        logger.error(f"Liquidation failed: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Liquidation failed: {str(e)}"
-        )
+
+def _start_liquidation(reason: str) -> asyncio.Queue:
+    """
+    Run liquidate_all_stream() in its own task, feeding a queue.
+
+    The task is registered in _liquidation_tasks before this returns, and
+    runs to completion even if the client disconnects mid-stream.
+
+    Args:
+        reason: Reason for liquidation (logged for audit trail)
+
+    Returns:
+        Queue of progress events, terminated by None
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _run() -> None:
+        try:
+            async for event in liquidate_all_stream(reason=reason):
+                if event["event"] == "started":
+                    # EMERGENCY_STOP is set before the first event
+                    invalidate_status_cache()
+                await queue.put(event)
+        except Exception as e:
+            logger.error("Liquidation failed: %s", e)
+            await queue.put({"event": "error", "detail": f"Liquidation failed: {str(e)}"})
+        finally:
+            invalidate_status_cache()
+            await queue.put(None)
+
+    task = asyncio.create_task(_run())
+    _liquidation_tasks.add(task)
+    task.add_done_callback(_liquidation_tasks.discard)
+    return queue
+
+
+async def _liquidation_events(queue: asyncio.Queue) -> AsyncIterator[bytes]:
+    """Format liquidation progress from the queue as Server-Sent Events."""
+    while (event := await queue.get()) is not None:
+        yield f"event: {event['event']}\ndata: ".encode() + orjson.dumps(event) + b"\n\n"
 
 
 @router.post("/init", response_model=InitConfigResponse)
@@ -284,16 +519,17 @@ async def init_config(request: InitConfigRequest):
         initial_balance: Starting portfolio value in USD
         max_drawdown_pct: Maximum allowed drawdown (default: 0.20 = 20%)
     """
-    try:
+    with _http_500("Failed to initialize config"):
         await initialize_system_config(
             initial_balance=request.initial_balance,
             max_drawdown_pct=request.max_drawdown_pct,
         )
+        invalidate_status_cache()
 
         logger.info(
-            f"System config initialized: "
-            f"${request.initial_balance:.2f}, "
-            f"max drawdown {request.max_drawdown_pct * 100:.0f}%"
+            "System config initialized: $%.2f, max drawdown %.0f%%",
+            request.initial_balance,
+            request.max_drawdown_pct * 100,
         )
 
         return InitConfigResponse(
@@ -302,32 +538,68 @@ async def init_config(request: InitConfigRequest):
             max_drawdown_pct=request.max_drawdown_pct,
         )
 
-    except Exception as e:
-        logger.error(f"Failed to initialize config: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to initialize config: {str(e)}"
-        )
 
-
-@router.get("/portfolio")
-async def get_portfolio():
+@router.get("/portfolio", response_model=PortfolioResponse)
+async def get_portfolio(request: Request):
     """
     Get current portfolio breakdown.
 
     Returns detailed breakdown of portfolio value by asset.
+
+    Clients can instead stream one record per asset as each is priced,
+    followed by a final record with the total, by sending:
+    - `Accept: application/x-ndjson` - newline-delimited JSON
+    - `Accept: application/msgpack` - concatenated MessagePack objects
+      (requires the optional ormsgpack package; falls back to JSON)
     """
-    try:
+    accept = request.headers.get("accept", "")
+
+    if HAS_MSGPACK and "application/msgpack" in accept:
+        return StreamingResponse(
+            _portfolio_stream(ormsgpack.packb),
+            media_type="application/msgpack",
+        )
+
+    if "application/x-ndjson" in accept:
+        return StreamingResponse(
+            _portfolio_stream(_encode_ndjson),
+            media_type="application/x-ndjson",
+        )
+
+    with _http_500("Failed to get portfolio"):
         total_value, breakdown = await get_portfolio_value()
 
-        return {
-            "total_value_usd": total_value,
-            "breakdown": breakdown,
-        }
+        return PortfolioResponse(
+            total_value_usd=total_value,
+            breakdown=breakdown,
+        )
 
+
+def _encode_ndjson(record: dict) -> bytes:
+    """Encode one stream record as a JSON line."""
+    return orjson.dumps(record) + b"\n"
+
+
+async def _portfolio_stream(encode: Callable[[dict], bytes]) -> AsyncIterator[bytes]:
+    """
+    Yield the portfolio breakdown as encoded records, total last.
+
+    Args:
+        encode: Serializer for a single record (JSON line or MessagePack)
+    """
+    total_value = 0.0
+    try:
+        async for currency, amount, value_usd in iter_portfolio_value():
+            total_value += value_usd
+            yield encode({
+                "currency": currency,
+                "amount": amount,
+                "value_usd": value_usd,
+            })
     except Exception as e:
-        logger.error(f"Failed to get portfolio: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get portfolio: {str(e)}"
-        )
+        # Headers are already sent, so report the failure in-band
+        logger.error("Failed to stream portfolio: %s", e)
+        yield encode({"error": f"Failed to get portfolio: {str(e)}"})
+        return
+
+    yield encode({"total_value_usd": total_value})
@@ -7,57 +7,167 @@ variables with validation and sensible defaults.
 
 import os
 from dataclasses import dataclass, field
-from typing import Optional, List
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """
+    Load .env into os.environ, once per process.
+
+    Called lazily on the first env read rather than at import, so importing
+    this module does no file I/O.
+
+    With APP_ENV_CACHED=1 the values come from the _env_cache module written
+    by scripts/build_env_cache.py instead, skipping dotenv parsing. Missing
+    cache falls back to .env. Like load_dotenv, existing variables win.
+    """
+    if os.getenv("APP_ENV_CACHED") == "1":
+        try:
+            from _env_cache import ENV
+        except ImportError:
+            pass
+        else:
+            for key, value in ENV.items():
+                os.environ.setdefault(key, value)
+            return True
+
+    load_dotenv()
+    return True
+
+
+def _reset_env() -> None:
+    """Allow the next env read to reload .env (for tests that rewrite it)."""
+    _load_env.cache_clear()
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on", "t", "y"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean env value; 1/true/yes/on/t/y (any case) are truthy."""
+    # Exact spellings hit the set directly; only odd casing/whitespace is normalized
+    return value in _TRUTHY or value.strip().lower() in _TRUTHY
+
+
+def _env(key: str, default: Any = None, cast: Callable[[str], Any] = str) -> Any:
+    """
+    Read an environment variable and parse it.
+
+    The environment is read on every call (not memoized) so that tests and
+    runtime overrides via os.environ are always respected.
+
+    Args:
+        key: Environment variable name
+        default: Typed value returned when the variable is unset
+        cast: Parser applied to the raw string value (e.g. int, float)
+
+    Returns:
+        Parsed value, or default if the variable is unset
+    """
+    _load_env()
+    value = os.getenv(key, default)
+    return cast(value) if isinstance(value, str) else value
+
+
+def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Read a raw environment variable, loading .env on first use.
+
+    For modules outside the config dataclasses (database URL, CORS origins)
+    so they share the lazy .env load instead of calling load_dotenv at import.
+
+    Args:
+        key: Environment variable name
+        default: Value returned when the variable is unset
+
+    Returns:
+        The variable's value, or default if unset
+    """
+    return _env(key, default)
+
+
+def _env_first(
+    keys: Tuple[str, ...], default: Any = None, cast: Callable[[str], Any] = str
+) -> Any:
+    """Read the first of keys that is set, falling back to default."""
+    for key in keys:
+        value = _env(key, None, cast)
+        if value is not None:
+            return value
+    return default
+
+
+def _env_field(
+    key: Union[str, Tuple[str, ...]],
+    default: Any = None,
+    cast: Callable[[str], Any] = str,
+    *,
+    secret: bool = False,
+) -> Any:
+    """
+    Declare a dataclass field populated from an environment variable.
+
+    The variable is read through _env when the instance is built, so the
+    field's (key, default, cast) reads as a schema entry. A tuple of keys
+    means "first one set wins". Secret fields are left out of the
+    generated __repr__ so configs can be logged safely.
+    """
+    read = _env_first if isinstance(key, tuple) else _env
+    return field(default_factory=partial(read, key, default, cast), repr=not secret)
 
 
-@dataclass
+def to_async_url(url: str) -> str:
+    """
+    Rewrite a postgres:// or postgresql:// URL to use the asyncpg driver.
+
+    Other URLs (including ones that already name a driver) are returned
+    unchanged.
+    """
+    if url.startswith("postgres://"):
+        return "postgresql+asyncpg://" + url[len("postgres://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    return url
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
-    """Database connection configuration."""
+    """
+    Database connection configuration.
 
-    url: str = field(default_factory=lambda: os.getenv("DATABASE_URL", ""))
-    pool_size: int = field(
-        default_factory=lambda: int(os.getenv("DATABASE_POOL_SIZE", "10"))
-    )
-    debug: bool = field(
-        default_factory=lambda: os.getenv("DEBUG", "").lower() == "true"
-    )
+    Frozen so the derived async URL can be computed once at construction.
+    """
+
+    url: str = _env_field("DATABASE_URL", "", secret=True)
+    pool_size: int = _env_field("DATABASE_POOL_SIZE", 10, int)
+    debug: bool = _env_field("DEBUG", False, _parse_bool)
+
+    # URL in async-compatible (asyncpg) format, derived in __post_init__
+    async_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass, so bypass __setattr__ for the derived field
+        object.__setattr__(self, "async_url", to_async_url(self.url))
 
     def get_async_url(self) -> str:
         """Convert URL to async-compatible format."""
-        url = self.url
-        if url.startswith("postgres://"):
-            url = url.replace("postgres://", "postgresql+asyncpg://", 1)
-        elif url.startswith("postgresql://"):
-            url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        return url
+        return self.async_url
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KrakenConfig:
     """Kraken API configuration."""
 
-    api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("KRAKEN_API_KEY")
-    )
-    api_secret: Optional[str] = field(
-        default_factory=lambda: os.getenv("KRAKEN_API_SECRET")
-    )
+    api_key: Optional[str] = _env_field("KRAKEN_API_KEY", secret=True)
+    api_secret: Optional[str] = _env_field("KRAKEN_API_SECRET", secret=True)
     # Private key for trading operations (Story 3.1)
-    private_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("KRAKEN_PRIVATE_KEY")
-    )
+    private_key: Optional[str] = _env_field("KRAKEN_PRIVATE_KEY", secret=True)
     # Sandbox mode for testing without real orders (Story 3.1)
-    sandbox_mode: bool = field(
-        default_factory=lambda: os.getenv("KRAKEN_SANDBOX_MODE", "true").lower() == "true"
-    )
-    rate_limit_ms: int = field(
-        default_factory=lambda: int(os.getenv("KRAKEN_RATE_LIMIT_MS", "500"))
-    )
+    sandbox_mode: bool = _env_field("KRAKEN_SANDBOX_MODE", True, _parse_bool)
+    rate_limit_ms: int = _env_field("KRAKEN_RATE_LIMIT_MS", 500, int)
     enable_rate_limit: bool = True
     retry_count: int = 3
     retry_min_wait: int = 2
@@ -84,48 +194,32 @@ class KrakenConfig:
                 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LunarCrushConfig:
     """LunarCrush API configuration."""
 
-    api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("LUNARCRUSH_API_KEY")
-    )
+    api_key: Optional[str] = _env_field("LUNARCRUSH_API_KEY", secret=True)
     # Free tier: 300 calls/day, Pro: 10000 calls/day
-    daily_limit: int = field(
-        default_factory=lambda: int(os.getenv("LUNARCRUSH_DAILY_LIMIT", "300"))
-    )
+    daily_limit: int = _env_field("LUNARCRUSH_DAILY_LIMIT", 300, int)
     # Number of groups for rotation strategy (to stay within API limits)
-    rotation_groups: int = field(
-        default_factory=lambda: int(os.getenv("LUNARCRUSH_ROTATION_GROUPS", "3"))
-    )
+    rotation_groups: int = _env_field("LUNARCRUSH_ROTATION_GROUPS", 3, int)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SocialConfig:
     """Social media API configuration."""
 
     # Bluesky
-    bluesky_handle: Optional[str] = field(
-        default_factory=lambda: os.getenv("BLUESKY_HANDLE")
-    )
-    bluesky_password: Optional[str] = field(
-        default_factory=lambda: os.getenv("BLUESKY_PASSWORD")
-    )
+    bluesky_handle: Optional[str] = _env_field("BLUESKY_HANDLE")
+    bluesky_password: Optional[str] = _env_field("BLUESKY_PASSWORD", secret=True)
 
     # Telegram
-    telegram_api_id: Optional[str] = field(
-        default_factory=lambda: os.getenv("TELEGRAM_API_ID")
-    )
-    telegram_api_hash: Optional[str] = field(
-        default_factory=lambda: os.getenv("TELEGRAM_API_HASH")
-    )
-    telegram_phone: Optional[str] = field(
-        default_factory=lambda: os.getenv("TELEGRAM_PHONE")
-    )
+    telegram_api_id: Optional[str] = _env_field("TELEGRAM_API_ID")
+    telegram_api_hash: Optional[str] = _env_field("TELEGRAM_API_HASH", secret=True)
+    telegram_phone: Optional[str] = _env_field("TELEGRAM_PHONE", secret=True)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchedulerConfig:
     """APScheduler configuration."""
 
@@ -133,47 +227,38 @@ class SchedulerConfig:
     # Cron expression for 15-minute intervals: 0, 15, 30, 45 minutes
     ingest_cron_minutes: str = "0,15,30,45"
     # Run immediate ingestion on startup
-    run_on_startup: bool = field(
-        default_factory=lambda: os.getenv("RUN_INGESTION_ON_STARTUP", "false").lower() == "true"
-    )
+    run_on_startup: bool = _env_field("RUN_INGESTION_ON_STARTUP", False, _parse_bool)
     # Run sentiment ingestion on startup
-    run_sentiment_on_startup: bool = field(
-        default_factory=lambda: os.getenv("RUN_SENTIMENT_ON_STARTUP", "false").lower() == "true"
-    )
+    run_sentiment_on_startup: bool = _env_field("RUN_SENTIMENT_ON_STARTUP", False, _parse_bool)
+    # Council graph runs in flight at once during a cycle (bounded by LLM rate limits)
+    council_concurrency: int = _env_field("COUNCIL_MAX_CONCURRENCY", 4, int)
+
+
+# Shared GEMINI_MODEL fallback for the agent and vision models, declared once
+# like the ATR settings below
+_GEMINI_MODEL_DEFAULT = "gemini-2.0-flash-lite"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VertexAIConfig:
     """Google Vertex AI configuration for LangGraph agents (Story 2.1)."""
 
-    project_id: Optional[str] = field(
-        default_factory=lambda: os.getenv("GOOGLE_CLOUD_PROJECT")
-    )
-    location: str = field(
-        default_factory=lambda: os.getenv("VERTEX_AI_LOCATION", "us-central1")
-    )
-    credentials_path: Optional[str] = field(
-        default_factory=lambda: os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    )
+    project_id: Optional[str] = _env_field("GOOGLE_CLOUD_PROJECT")
+    location: str = _env_field("VERTEX_AI_LOCATION", "us-central1")
+    credentials_path: Optional[str] = _env_field("GOOGLE_APPLICATION_CREDENTIALS")
     # Model selection for agents (fallback to GEMINI_MODEL)
-    model_name: str = field(
-        default_factory=lambda: os.getenv("VERTEX_AI_MODEL", os.getenv("GEMINI_MODEL", "gemini-2.0-flash-lite"))
-    )
+    model_name: str = _env_field(("VERTEX_AI_MODEL", "GEMINI_MODEL"), _GEMINI_MODEL_DEFAULT)
     # Temperature for agent responses (lower = more deterministic)
-    temperature: float = field(
-        default_factory=lambda: float(os.getenv("VERTEX_AI_TEMPERATURE", "0.1"))
-    )
+    temperature: float = _env_field("VERTEX_AI_TEMPERATURE", 0.1, float)
     # Maximum tokens for responses
-    max_output_tokens: int = field(
-        default_factory=lambda: int(os.getenv("VERTEX_AI_MAX_TOKENS", "2048"))
-    )
+    max_output_tokens: int = _env_field("VERTEX_AI_MAX_TOKENS", 2048, int)
 
     def is_configured(self) -> bool:
         """Check if Vertex AI is properly configured."""
-        return self.project_id is not None and len(self.project_id) > 0
+        return bool(self.project_id)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeminiConfig:
     """
     Google Gemini AI configuration for Sentiment Analysis (Story 2.2).
@@ -182,25 +267,66 @@ class GeminiConfig:
     cost-effective text analysis with Gemini Flash models.
     """
 
-    api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("GOOGLE_AI_API_KEY")
-    )
+    api_key: Optional[str] = _env_field("GOOGLE_AI_API_KEY", secret=True)
     # Gemini Flash model for sentiment analysis (fast and cost-effective)
-    model_name: str = field(
-        default_factory=lambda: os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
-    )
+    model_name: str = _env_field("GEMINI_MODEL", "gemini-1.5-flash")
     # Low temperature for consistent sentiment analysis
-    temperature: float = field(
-        default_factory=lambda: float(os.getenv("GEMINI_TEMPERATURE", "0.3"))
-    )
+    temperature: float = _env_field("GEMINI_TEMPERATURE", 0.3, float)
     # Maximum tokens for sentiment responses
-    max_output_tokens: int = field(
-        default_factory=lambda: int(os.getenv("GEMINI_MAX_TOKENS", "1024"))
-    )
+    max_output_tokens: int = _env_field("GEMINI_MAX_TOKENS", 1024, int)
 
     def is_configured(self) -> bool:
         """Check if Gemini API is properly configured."""
-        return self.api_key is not None and len(self.api_key) > 0
+        return bool(self.api_key)
+
+
+# API key genai was last configured with, so configure() runs once per key
+_genai_api_key: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
+def load_genai():
+    """
+    Import google-generativeai once and return the module.
+
+    The import takes over a second, so it is kept off this module's import
+    path. main.py calls this during startup when Gemini is configured, so
+    a missing package fails the boot instead of the first council cycle.
+    """
+    import google.generativeai as genai
+
+    return genai
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure google-generativeai, skipping repeat calls with the same key."""
+    global _genai_api_key
+    if _genai_api_key == api_key:
+        return
+
+    load_genai().configure(api_key=api_key)
+    _genai_api_key = api_key
+
+
+@lru_cache(maxsize=4)
+def _build_model(
+    api_key: str, model_name: str, temperature: float, max_output_tokens: int
+):
+    """
+    Build a GenerativeModel, memoized on its effective settings.
+
+    Factories asking for identical settings share one model, and a changed
+    config yields a new model rather than a stale cached one.
+    """
+    genai = load_genai()
+    _configure_genai(api_key)
+    return genai.GenerativeModel(
+        model_name=model_name,
+        generation_config={
+            "temperature": temperature,
+            "max_output_tokens": max_output_tokens,
+        }
+    )
 
 
 def get_gemini_flash_model():
@@ -209,6 +335,7 @@ def get_gemini_flash_model():
 
     Uses google-generativeai library with Gemini Flash for fast,
     cost-effective sentiment analysis in the Council of Agents.
+    Models are memoized on their settings and reused across calls.
 
     Returns:
         Configured GenerativeModel instance
@@ -216,27 +343,21 @@ def get_gemini_flash_model():
     Raises:
         ValueError: If GOOGLE_AI_API_KEY is not set
     """
-    import google.generativeai as genai
-
-    gemini_config = GeminiConfig()
+    gemini_config = get_config().gemini
 
     if not gemini_config.is_configured():
         raise ValueError("GOOGLE_AI_API_KEY not set")
 
-    genai.configure(api_key=gemini_config.api_key)
-
     # Gemini Flash - optimized for fast text analysis
-    model = genai.GenerativeModel(
-        model_name=gemini_config.model_name,
-        generation_config={
-            "temperature": gemini_config.temperature,
-            "max_output_tokens": gemini_config.max_output_tokens,
-        }
+    return _build_model(
+        gemini_config.api_key,
+        gemini_config.model_name,
+        gemini_config.temperature,
+        gemini_config.max_output_tokens,
     )
-    return model
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OnChainConfig:
     """
     On-chain data provider configuration (Story 5.6).
@@ -246,58 +367,48 @@ class OnChainConfig:
     """
 
     # Master enable/disable switch
-    enabled: bool = field(
-        default_factory=lambda: os.getenv("ONCHAIN_ENABLED", "false").lower() == "true"
-    )
+    enabled: bool = _env_field("ONCHAIN_ENABLED", False, _parse_bool)
 
     # CryptoQuant API (primary provider - best free tier)
-    cryptoquant_api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("CRYPTOQUANT_API_KEY")
-    )
+    cryptoquant_api_key: Optional[str] = _env_field("CRYPTOQUANT_API_KEY", secret=True)
 
     # Santiment API (backup provider)
-    santiment_api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("SANTIMENT_API_KEY")
-    )
+    santiment_api_key: Optional[str] = _env_field("SANTIMENT_API_KEY", secret=True)
 
     # Glassnode API (premium provider)
-    glassnode_api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("GLASSNODE_API_KEY")
-    )
+    glassnode_api_key: Optional[str] = _env_field("GLASSNODE_API_KEY", secret=True)
 
     # Cache settings
-    cache_ttl_minutes: int = field(
-        default_factory=lambda: int(os.getenv("ONCHAIN_CACHE_TTL_MINUTES", "15"))
-    )
+    cache_ttl_minutes: int = _env_field("ONCHAIN_CACHE_TTL_MINUTES", 15, int)
 
     # Data fetch settings
-    lookback_days: int = field(
-        default_factory=lambda: int(os.getenv("ONCHAIN_LOOKBACK_DAYS", "7"))
-    )
+    lookback_days: int = _env_field("ONCHAIN_LOOKBACK_DAYS", 7, int)
 
     # Thresholds for signals
-    exchange_flow_spike_mult: float = field(
-        default_factory=lambda: float(os.getenv("EXCHANGE_FLOW_SPIKE_MULT", "2.0"))
-    )
-    whale_activity_threshold: int = field(
-        default_factory=lambda: int(os.getenv("WHALE_ACTIVITY_THRESHOLD", "100"))
-    )  # Number of large transactions
-    funding_rate_extreme_threshold: float = field(
-        default_factory=lambda: float(os.getenv("FUNDING_RATE_EXTREME_THRESHOLD", "0.1"))
-    )  # 0.1% per 8 hours is extreme
+    exchange_flow_spike_mult: float = _env_field("EXCHANGE_FLOW_SPIKE_MULT", 2.0, float)
+    # Number of large transactions
+    whale_activity_threshold: int = _env_field("WHALE_ACTIVITY_THRESHOLD", 100, int)
+    # 0.1% per 8 hours is extreme
+    funding_rate_extreme_threshold: float = _env_field("FUNDING_RATE_EXTREME_THRESHOLD", 0.1, float)
 
     def is_configured(self) -> bool:
         """Check if on-chain is enabled AND any provider is configured."""
         if not self.enabled:
             return False
-        return any([
-            self.cryptoquant_api_key,
-            self.santiment_api_key,
-            self.glassnode_api_key
-        ])
+        return bool(
+            self.cryptoquant_api_key
+            or self.santiment_api_key
+            or self.glassnode_api_key
+        )
+
+
+# ATR settings read by both RiskConfig and EnhancedRiskConfig, declared once
+# so the two sections cannot drift apart
+_ATR_PERIOD_ENV = ("RISK_ATR_PERIOD", 14, int)
+_ATR_MULTIPLIER_ENV = ("RISK_ATR_MULTIPLIER", 2.0, float)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
     """
     Risk management configuration for ATR-based stop loss (Story 3.2).
@@ -309,25 +420,15 @@ class RiskConfig:
     """
 
     # ATR calculation period (default: 14 - industry standard)
-    atr_period: int = field(
-        default_factory=lambda: int(os.getenv("RISK_ATR_PERIOD", "14"))
-    )
+    atr_period: int = _env_field(*_ATR_PERIOD_ENV)
     # ATR multiplier for stop loss distance (default: 2.0)
-    atr_multiplier: float = field(
-        default_factory=lambda: float(os.getenv("RISK_ATR_MULTIPLIER", "2.0"))
-    )
+    atr_multiplier: float = _env_field(*_ATR_MULTIPLIER_ENV)
     # Maximum stop loss as percentage of entry (default: 20%)
-    max_stop_loss_percentage: float = field(
-        default_factory=lambda: float(os.getenv("RISK_MAX_STOP_LOSS_PERCENTAGE", "0.20"))
-    )
+    max_stop_loss_percentage: float = _env_field("RISK_MAX_STOP_LOSS_PERCENTAGE", 0.2, float)
     # Minimum stop loss as percentage of entry (default: 2%)
-    min_stop_loss_percentage: float = field(
-        default_factory=lambda: float(os.getenv("RISK_MIN_STOP_LOSS_PERCENTAGE", "0.02"))
-    )
+    min_stop_loss_percentage: float = _env_field("RISK_MIN_STOP_LOSS_PERCENTAGE", 0.02, float)
     # Default risk percentage per trade for position sizing (default: 2%)
-    default_risk_per_trade: float = field(
-        default_factory=lambda: float(os.getenv("RISK_DEFAULT_PER_TRADE", "0.02"))
-    )
+    default_risk_per_trade: float = _env_field("RISK_DEFAULT_PER_TRADE", 0.02, float)
 
     def validate(self) -> None:
         """
@@ -355,7 +456,32 @@ class RiskConfig:
             )
 
 
-@dataclass
+def _check_bounds(cfg: Any, bounds: Tuple[Tuple[str, float, float, str], ...]) -> None:
+    """
+    Check each (field, min, max, rule) range in one loop.
+
+    Raises:
+        ValueError: For the first field outside its inclusive range
+    """
+    for name, low, high, rule in bounds:
+        value = getattr(cfg, name)
+        if not (low <= value <= high):
+            raise ValueError(f"{rule}, got {value}")
+
+
+# (field, min, max, rule) ranges checked by EnhancedRiskConfig.validate()
+_ENHANCED_RISK_BOUNDS = (
+    ("max_drawdown_pct", 1.0, 50.0, "Max drawdown must be 1-50%"),
+    ("per_trade_risk_pct", 0.1, 5.0, "Per-trade risk must be 0.1-5%"),
+    ("max_single_position_pct", 1.0, 25.0, "Max position must be 1-25%"),
+    ("max_correlated_exposure_pct", 10.0, 100.0, "Correlated exposure must be 10-100%"),
+    ("daily_loss_limit_pct", 1.0, 20.0, "Daily loss limit must be 1-20%"),
+    ("correlation_threshold", 0.5, 1.0, "Correlation threshold must be 0.5-1.0"),
+    ("alert_threshold_pct", 50.0, 99.0, "Alert threshold must be 50-99%"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class EnhancedRiskConfig:
     """
     Enhanced risk management configuration (Story 5.5).
@@ -369,79 +495,38 @@ class EnhancedRiskConfig:
     """
 
     # Maximum Portfolio Drawdown (reduced from 20% to 15%)
-    max_drawdown_pct: float = field(
-        default_factory=lambda: float(os.getenv("MAX_DRAWDOWN_PCT", "15.0"))
-    )
+    max_drawdown_pct: float = _env_field("MAX_DRAWDOWN_PCT", 15.0, float)
 
     # Per-Trade Risk (reduced from 2% to 1.5%)
-    per_trade_risk_pct: float = field(
-        default_factory=lambda: float(os.getenv("PER_TRADE_RISK_PCT", "1.5"))
-    )
+    per_trade_risk_pct: float = _env_field("PER_TRADE_RISK_PCT", 1.5, float)
 
     # Maximum Single Position Size (new)
-    max_single_position_pct: float = field(
-        default_factory=lambda: float(os.getenv("MAX_SINGLE_POSITION_PCT", "10.0"))
-    )
+    max_single_position_pct: float = _env_field("MAX_SINGLE_POSITION_PCT", 10.0, float)
 
     # Maximum Correlated Exposure (new)
-    max_correlated_exposure_pct: float = field(
-        default_factory=lambda: float(os.getenv("MAX_CORRELATED_EXPOSURE_PCT", "30.0"))
-    )
+    max_correlated_exposure_pct: float = _env_field("MAX_CORRELATED_EXPOSURE_PCT", 30.0, float)
 
     # Correlation threshold to consider assets "correlated"
-    correlation_threshold: float = field(
-        default_factory=lambda: float(os.getenv("CORRELATION_THRESHOLD", "0.7"))
-    )
+    correlation_threshold: float = _env_field("CORRELATION_THRESHOLD", 0.7, float)
 
     # Alert threshold (percentage of limit)
-    alert_threshold_pct: float = field(
-        default_factory=lambda: float(os.getenv("RISK_ALERT_THRESHOLD_PCT", "80.0"))
-    )
+    alert_threshold_pct: float = _env_field("RISK_ALERT_THRESHOLD_PCT", 80.0, float)
 
     # Daily loss limit (stop trading for day if reached)
-    daily_loss_limit_pct: float = field(
-        default_factory=lambda: float(os.getenv("DAILY_LOSS_LIMIT_PCT", "5.0"))
-    )
+    daily_loss_limit_pct: float = _env_field("DAILY_LOSS_LIMIT_PCT", 5.0, float)
 
     # Existing ATR-based stop loss settings
-    atr_period: int = field(
-        default_factory=lambda: int(os.getenv("RISK_ATR_PERIOD", "14"))
-    )
-    atr_multiplier: float = field(
-        default_factory=lambda: float(os.getenv("RISK_ATR_MULTIPLIER", "2.0"))
-    )
-    max_stop_loss_pct: float = field(
-        default_factory=lambda: float(os.getenv("RISK_MAX_STOP_LOSS_PCT", "15.0"))
-    )
-    min_stop_loss_pct: float = field(
-        default_factory=lambda: float(os.getenv("RISK_MIN_STOP_LOSS_PCT", "2.0"))
-    )
+    atr_period: int = _env_field(*_ATR_PERIOD_ENV)
+    atr_multiplier: float = _env_field(*_ATR_MULTIPLIER_ENV)
+    max_stop_loss_pct: float = _env_field("RISK_MAX_STOP_LOSS_PCT", 15.0, float)
+    min_stop_loss_pct: float = _env_field("RISK_MIN_STOP_LOSS_PCT", 2.0, float)
 
     def validate(self) -> None:
-        """Validate risk configuration values."""
-        if not (1.0 <= self.max_drawdown_pct <= 50.0):
-            raise ValueError(f"Max drawdown must be 1-50%, got {self.max_drawdown_pct}")
-
-        if not (0.1 <= self.per_trade_risk_pct <= 5.0):
-            raise ValueError(f"Per-trade risk must be 0.1-5%, got {self.per_trade_risk_pct}")
-
-        if not (1.0 <= self.max_single_position_pct <= 25.0):
-            raise ValueError(f"Max position must be 1-25%, got {self.max_single_position_pct}")
-
-        if not (10.0 <= self.max_correlated_exposure_pct <= 100.0):
-            raise ValueError(f"Correlated exposure must be 10-100%, got {self.max_correlated_exposure_pct}")
-
-        if not (1.0 <= self.daily_loss_limit_pct <= 20.0):
-            raise ValueError(f"Daily loss limit must be 1-20%, got {self.daily_loss_limit_pct}")
-
-        if not (0.5 <= self.correlation_threshold <= 1.0):
-            raise ValueError(f"Correlation threshold must be 0.5-1.0, got {self.correlation_threshold}")
+        """Validate risk configuration values against _ENHANCED_RISK_BOUNDS."""
+        _check_bounds(self, _ENHANCED_RISK_BOUNDS)
 
-        if not (50.0 <= self.alert_threshold_pct <= 99.0):
-            raise ValueError(f"Alert threshold must be 50-99%, got {self.alert_threshold_pct}")
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrailingStopConfig:
     """
     Enhanced Trailing Stop configuration (Story 5.12).
@@ -455,50 +540,33 @@ class TrailingStopConfig:
 
     # Breakeven trigger: move stop to entry after price rises this many ATRs
     # Increased from 2.0 to 3.0 for crypto volatility
-    breakeven_atr_trigger: float = field(
-        default_factory=lambda: float(os.getenv("TRAILING_BREAKEVEN_ATR", "3.0"))
-    )
+    breakeven_atr_trigger: float = _env_field("TRAILING_BREAKEVEN_ATR", 3.0, float)
 
     # Progressive trailing multipliers (tighten as profit grows)
     # These define ATR multiplier at different profit levels
-    trail_mult_initial: float = field(
-        default_factory=lambda: float(os.getenv("TRAILING_MULT_INITIAL", "2.5"))
-    )  # 0-1× ATR profit
-    trail_mult_profit_1x: float = field(
-        default_factory=lambda: float(os.getenv("TRAILING_MULT_1X", "2.0"))
-    )  # 1-2× ATR profit
-    trail_mult_profit_2x: float = field(
-        default_factory=lambda: float(os.getenv("TRAILING_MULT_2X", "1.75"))
-    )  # 2-3× ATR profit
-    trail_mult_profit_3x: float = field(
-        default_factory=lambda: float(os.getenv("TRAILING_MULT_3X", "1.5"))
-    )  # 3+× ATR profit (lock profits)
+    trail_mult_initial: float = _env_field("TRAILING_MULT_INITIAL", 2.5, float)  # 0-1× ATR profit
+    trail_mult_profit_1x: float = _env_field("TRAILING_MULT_1X", 2.0, float)  # 1-2× ATR profit
+    trail_mult_profit_2x: float = _env_field("TRAILING_MULT_2X", 1.75, float)  # 2-3× ATR profit
+    # 3+× ATR profit (lock profits)
+    trail_mult_profit_3x: float = _env_field("TRAILING_MULT_3X", 1.5, float)
 
     # Asset tier-specific initial ATR multipliers
     # Higher volatility assets get wider stops
-    tier_mult_flagship: float = field(
-        default_factory=lambda: float(os.getenv("TIER_MULT_FLAGSHIP", "2.0"))
-    )  # BTC, ETH - lower volatility
-    tier_mult_bluechip: float = field(
-        default_factory=lambda: float(os.getenv("TIER_MULT_BLUECHIP", "2.5"))
-    )  # SOL, LINK, etc.
-    tier_mult_midcap: float = field(
-        default_factory=lambda: float(os.getenv("TIER_MULT_MIDCAP", "3.0"))
-    )  # Higher volatility mid-caps
-    tier_mult_speculative: float = field(
-        default_factory=lambda: float(os.getenv("TIER_MULT_SPECULATIVE", "3.5"))
-    )  # Highest volatility
+    # BTC, ETH - lower volatility
+    tier_mult_flagship: float = _env_field("TIER_MULT_FLAGSHIP", 2.0, float)
+    tier_mult_bluechip: float = _env_field("TIER_MULT_BLUECHIP", 2.5, float)  # SOL, LINK, etc.
+    # Higher volatility mid-caps
+    tier_mult_midcap: float = _env_field("TIER_MULT_MIDCAP", 3.0, float)
+    # Highest volatility
+    tier_mult_speculative: float = _env_field("TIER_MULT_SPECULATIVE", 3.5, float)
 
     # Time-decay: tighten stops for positions older than X hours
-    time_decay_start_hours: int = field(
-        default_factory=lambda: int(os.getenv("TIME_DECAY_START_HOURS", "24"))
-    )  # Start tightening after 24h
-    time_decay_mult_reduction: float = field(
-        default_factory=lambda: float(os.getenv("TIME_DECAY_MULT_REDUCTION", "0.1"))
-    )  # Reduce multiplier by 0.1 per 24h
-    time_decay_min_mult: float = field(
-        default_factory=lambda: float(os.getenv("TIME_DECAY_MIN_MULT", "1.25"))
-    )  # Never go below 1.25× ATR
+    # Start tightening after 24h
+    time_decay_start_hours: int = _env_field("TIME_DECAY_START_HOURS", 24, int)
+    # Reduce multiplier by 0.1 per 24h
+    time_decay_mult_reduction: float = _env_field("TIME_DECAY_MULT_REDUCTION", 0.1, float)
+    # Never go below 1.25× ATR
+    time_decay_min_mult: float = _env_field("TIME_DECAY_MIN_MULT", 1.25, float)
 
     def validate(self) -> None:
         """Validate trailing stop configuration values."""
@@ -512,7 +580,7 @@ class TrailingStopConfig:
             raise ValueError(f"Min trailing mult must be >= 1.0, got {self.time_decay_min_mult}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScannerConfig:
     """
     Dynamic Opportunity Scanner configuration (Story 5.8).
@@ -521,64 +589,34 @@ class ScannerConfig:
     """
 
     # Enable/disable scanner
-    enabled: bool = field(
-        default_factory=lambda: os.getenv("SCANNER_ENABLED", "true").lower() == "true"
-    )
+    enabled: bool = _env_field("SCANNER_ENABLED", True, _parse_bool)
 
     # Minimum 24h volume in USD to consider a pair
-    min_volume_usd: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_MIN_VOLUME", "1000000"))
-    )
+    min_volume_usd: float = _env_field("SCANNER_MIN_VOLUME", 1000000.0, float)
 
     # Maximum assets to include in active universe
-    universe_size: int = field(
-        default_factory=lambda: int(os.getenv("SCANNER_UNIVERSE_SIZE", "10"))
-    )
+    universe_size: int = _env_field("SCANNER_UNIVERSE_SIZE", 10, int)
 
     # Minimum score threshold to include in universe
-    min_score: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_MIN_SCORE", "40"))
-    )
+    min_score: float = _env_field("SCANNER_MIN_SCORE", 40.0, float)
 
     # Score weights (must sum to ~82 for full score before liquidity bonus)
-    weight_rsi_oversold: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_RSI", "15"))
-    )
-    weight_price_capitulation: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_CAPITULATION", "15"))
-    )
-    weight_volume_spike: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_VOLUME_SPIKE", "12"))
-    )
-    weight_adx_weak: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_ADX", "12"))
-    )
-    weight_bollinger_lower: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_BOLLINGER", "12"))
-    )
-    weight_vwap_discount: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_VWAP", "6"))
-    )
-    weight_liquidity_bonus: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_WEIGHT_LIQUIDITY", "10"))
-    )
+    weight_rsi_oversold: float = _env_field("SCANNER_WEIGHT_RSI", 15.0, float)
+    weight_price_capitulation: float = _env_field("SCANNER_WEIGHT_CAPITULATION", 15.0, float)
+    weight_volume_spike: float = _env_field("SCANNER_WEIGHT_VOLUME_SPIKE", 12.0, float)
+    weight_adx_weak: float = _env_field("SCANNER_WEIGHT_ADX", 12.0, float)
+    weight_bollinger_lower: float = _env_field("SCANNER_WEIGHT_BOLLINGER", 12.0, float)
+    weight_vwap_discount: float = _env_field("SCANNER_WEIGHT_VWAP", 6.0, float)
+    weight_liquidity_bonus: float = _env_field("SCANNER_WEIGHT_LIQUIDITY", 10.0, float)
 
     # Technical thresholds
-    rsi_oversold_threshold: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_RSI_THRESHOLD", "30"))
-    )
-    capitulation_threshold_pct: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_CAPITULATION_PCT", "10"))
-    )
-    volume_spike_mult: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_VOLUME_SPIKE_MULT", "2.0"))
-    )
-    adx_weak_threshold: float = field(
-        default_factory=lambda: float(os.getenv("SCANNER_ADX_THRESHOLD", "25"))
-    )
+    rsi_oversold_threshold: float = _env_field("SCANNER_RSI_THRESHOLD", 30.0, float)
+    capitulation_threshold_pct: float = _env_field("SCANNER_CAPITULATION_PCT", 10.0, float)
+    volume_spike_mult: float = _env_field("SCANNER_VOLUME_SPIKE_MULT", 2.0, float)
+    adx_weak_threshold: float = _env_field("SCANNER_ADX_THRESHOLD", 25.0, float)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeminiVisionConfig:
     """
     Google Gemini Pro Vision configuration for Chart Analysis (Story 2.3).
@@ -587,25 +625,22 @@ class GeminiVisionConfig:
     visual chart pattern recognition and scam wick detection.
     """
 
-    api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("GOOGLE_AI_API_KEY")
-    )
+    api_key: Optional[str] = _env_field("GOOGLE_AI_API_KEY", secret=True)
     # Gemini model for vision analysis (uses GEMINI_MODEL by default)
-    model_name: str = field(
-        default_factory=lambda: os.getenv("GEMINI_VISION_MODEL", os.getenv("GEMINI_MODEL", "gemini-2.0-flash-lite"))
-    )
+    model_name: str = _env_field(("GEMINI_VISION_MODEL", "GEMINI_MODEL"), _GEMINI_MODEL_DEFAULT)
     # Very low temperature for consistent chart analysis
-    temperature: float = field(
-        default_factory=lambda: float(os.getenv("GEMINI_VISION_TEMPERATURE", "0.2"))
-    )
+    temperature: float = _env_field("GEMINI_VISION_TEMPERATURE", 0.2, float)
     # Maximum tokens for vision responses
-    max_output_tokens: int = field(
-        default_factory=lambda: int(os.getenv("GEMINI_VISION_MAX_TOKENS", "2048"))
-    )
+    max_output_tokens: int = _env_field("GEMINI_VISION_MAX_TOKENS", 2048, int)
+
+    # Story 5.9 routing gate: Vision only runs for a BULLISH technical signal
+    # at least this strong, while fear is below this score
+    fear_threshold: int = _env_field("VISION_FEAR_THRESHOLD", 40, int)
+    min_tech_strength: int = _env_field("VISION_MIN_TECH_STRENGTH", 60, int)
 
     def is_configured(self) -> bool:
         """Check if Gemini Vision API is properly configured."""
-        return self.api_key is not None and len(self.api_key) > 0
+        return bool(self.api_key)
 
 
 def get_gemini_pro_vision_model():
@@ -614,6 +649,7 @@ def get_gemini_pro_vision_model():
 
     Uses google-generativeai library with Gemini Pro for
     complex visual chart pattern recognition in the Vision Agent.
+    Models are memoized on their settings and reused across calls.
 
     Story 2.3: Vision Agent & Chart Generation
 
@@ -623,27 +659,28 @@ def get_gemini_pro_vision_model():
     Raises:
         ValueError: If GOOGLE_AI_API_KEY is not set
     """
-    import google.generativeai as genai
-
-    vision_config = GeminiVisionConfig()
+    vision_config = get_config().gemini_vision
 
     if not vision_config.is_configured():
         raise ValueError("GOOGLE_AI_API_KEY not set")
 
-    genai.configure(api_key=vision_config.api_key)
-
     # Gemini Pro - optimized for complex visual analysis
-    model = genai.GenerativeModel(
-        model_name=vision_config.model_name,
-        generation_config={
-            "temperature": vision_config.temperature,
-            "max_output_tokens": vision_config.max_output_tokens,
-        }
+    return _build_model(
+        vision_config.api_key,
+        vision_config.model_name,
+        vision_config.temperature,
+        vision_config.max_output_tokens,
     )
-    return model
 
 
-@dataclass
+# (field, min, max, rule) ranges checked by MultiFactorConfig.validate()
+_MULTI_FACTOR_BOUNDS = (
+    ("min_factors_buy", 1, 6, "min_factors_buy must be 1-6"),
+    ("min_factors_sell", 1, 4, "min_factors_sell must be 1-4"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class MultiFactorConfig:
     """
     Multi-Factor Confirmation System configuration (Story 5.3, 5.11).
@@ -657,24 +694,31 @@ class MultiFactorConfig:
 
     # Minimum factors required for BUY signal (default: 2 of 6)
     # Story 5.11: Lowered from 3 to 2 for more responsive trading
-    min_factors_buy: int = field(
-        default_factory=lambda: int(os.getenv("MULTI_FACTOR_MIN_BUY", "2"))
-    )
+    min_factors_buy: int = _env_field("MULTI_FACTOR_MIN_BUY", 2, int)
 
     # Minimum factors required for SELL signal (default: 2 of 4)
-    min_factors_sell: int = field(
-        default_factory=lambda: int(os.getenv("MULTI_FACTOR_MIN_SELL", "2"))
-    )
+    min_factors_sell: int = _env_field("MULTI_FACTOR_MIN_SELL", 2, int)
 
     def validate(self) -> None:
         """Validate multi-factor configuration values."""
-        if not (1 <= self.min_factors_buy <= 6):
-            raise ValueError(f"min_factors_buy must be 1-6, got {self.min_factors_buy}")
-        if not (1 <= self.min_factors_sell <= 4):
-            raise ValueError(f"min_factors_sell must be 1-4, got {self.min_factors_sell}")
+        _check_bounds(self, _MULTI_FACTOR_BOUNDS)
+
+
+# (field, min, max, rule) ranges checked by BasketConfig.validate()
+_BASKET_BOUNDS = (
+    ("max_positions", 1, 20, "max_positions must be 1-20"),
+    ("max_single_position_pct", 5.0, 50.0, "max_single_position_pct must be 5-50%"),
+    ("max_correlation", 0.3, 1.0, "max_correlation must be 0.3-1.0"),
+    # Story 5.11: Relaxed thresholds for trend-confirmed pullback trading
+    ("fear_threshold_buy", 10, 60, "fear_threshold_buy must be 10-60"),
+    ("greed_threshold_sell", 60, 90, "greed_threshold_sell must be 60-90"),
+    # Position sizing
+    ("position_size_pct", 1.0, 25.0, "position_size_pct must be 1-25%"),
+    ("min_position_usd", 10.0, 500.0, "min_position_usd must be $10-$500"),
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BasketConfig:
     """
     Basket Trading System configuration (Story 5.9).
@@ -689,46 +733,30 @@ class BasketConfig:
     """
 
     # Maximum number of concurrent positions
-    max_positions: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_MAX_POSITIONS", "10"))
-    )
+    max_positions: int = _env_field("BASKET_MAX_POSITIONS", 10, int)
 
     # Minimum positions to maintain (avoid concentration)
-    min_positions: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_MIN_POSITIONS", "3"))
-    )
+    min_positions: int = _env_field("BASKET_MIN_POSITIONS", 3, int)
 
     # Maximum allocation to single position (% of portfolio)
-    max_single_position_pct: float = field(
-        default_factory=lambda: float(os.getenv("BASKET_MAX_SINGLE_PCT", "15.0"))
-    )
+    max_single_position_pct: float = _env_field("BASKET_MAX_SINGLE_PCT", 15.0, float)
 
     # Maximum correlation between basket members (0-1)
-    max_correlation: float = field(
-        default_factory=lambda: float(os.getenv("BASKET_MAX_CORRELATION", "0.7"))
-    )
+    max_correlation: float = _env_field("BASKET_MAX_CORRELATION", 0.7, float)
 
     # Correlation lookback period (days)
-    correlation_lookback_days: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_CORRELATION_DAYS", "30"))
-    )
+    correlation_lookback_days: int = _env_field("BASKET_CORRELATION_DAYS", 30, int)
 
     # Position rotation: minimum holding period (hours) before considering exit
-    min_hold_hours: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_MIN_HOLD_HOURS", "4"))
-    )
+    min_hold_hours: int = _env_field("BASKET_MIN_HOLD_HOURS", 4, int)
 
     # Position rotation: max age before forced review (hours)
-    max_position_age_hours: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_MAX_AGE_HOURS", "168"))
-    )  # 7 days
+    max_position_age_hours: int = _env_field("BASKET_MAX_AGE_HOURS", 168, int)  # 7 days
 
     # Enable hourly council (aligned with scanner) vs 15-min
     # Story 5.12: Default changed to 15-min (false) for crypto responsiveness
     # Vision agent removed = lower cost per cycle, can afford more frequent meetings
-    hourly_council_enabled: bool = field(
-        default_factory=lambda: os.getenv("BASKET_HOURLY_COUNCIL", "false").lower() == "true"
-    )
+    hourly_council_enabled: bool = _env_field("BASKET_HOURLY_COUNCIL", False, _parse_bool)
 
     # =============================================================================
     # BALANCED THRESHOLDS (Not Too Contrarian)
@@ -736,26 +764,19 @@ class BasketConfig:
 
     # Fear & Greed thresholds
     # Story 5.11: Increased fear_threshold to 50 for trend-confirmed pullback entries
-    fear_threshold_buy: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_FEAR_BUY", "50"))
-    )  # Buy when fear <= 50 (neutral/fear), not just extreme fear
-    greed_threshold_sell: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_GREED_SELL", "70"))
-    )  # Sell when greed >= 70
+    # Buy when fear <= 50 (neutral/fear), not just extreme fear
+    fear_threshold_buy: int = _env_field("BASKET_FEAR_BUY", 50, int)
+    greed_threshold_sell: int = _env_field("BASKET_GREED_SELL", 70, int)  # Sell when greed >= 70
 
     # RSI thresholds
     # Story 5.11: Increased rsi_oversold to 55 to allow pullback zone entries (40-55)
-    rsi_oversold: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_RSI_OVERSOLD", "55"))
-    )  # Was 35, now 55 for trend pullback entries
-    rsi_overbought: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_RSI_OVERBOUGHT", "70"))
-    )  # Standard overbought level
+    # Was 35, now 55 for trend pullback entries
+    rsi_oversold: int = _env_field("BASKET_RSI_OVERSOLD", 55, int)
+    rsi_overbought: int = _env_field("BASKET_RSI_OVERBOUGHT", 70, int)  # Standard overbought level
 
     # ADX threshold (increased to allow trending markets)
-    adx_max_for_entry: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_ADX_MAX", "40"))
-    )  # Was 25 - rejected trending markets
+    # Was 25 - rejected trending markets
+    adx_max_for_entry: int = _env_field("BASKET_ADX_MAX", 40, int)
 
     # =============================================================================
     # REVERSAL CONFIRMATION REQUIREMENTS
@@ -764,35 +785,25 @@ class BasketConfig:
 
     # Require MACD bullish crossover for BUY
     # Story 5.11: Changed to False - trend confirmation is done via multi-factor
-    require_macd_confirmation: bool = field(
-        default_factory=lambda: os.getenv("BASKET_REQUIRE_MACD", "false").lower() == "true"
-    )
+    require_macd_confirmation: bool = _env_field("BASKET_REQUIRE_MACD", False, _parse_bool)
 
     # Require higher-low pattern (price above prior swing low)
     # Story 5.11: Changed to False - not needed for pullback entries
-    require_higher_low: bool = field(
-        default_factory=lambda: os.getenv("BASKET_REQUIRE_HIGHER_LOW", "false").lower() == "true"
-    )
+    require_higher_low: bool = _env_field("BASKET_REQUIRE_HIGHER_LOW", False, _parse_bool)
 
     # Minimum candles since reversal to confirm it's holding
     # Story 5.11: Reduced from 3 to 1 for faster entries
-    reversal_confirmation_candles: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_REVERSAL_CANDLES", "1"))
-    )
+    reversal_confirmation_candles: int = _env_field("BASKET_REVERSAL_CANDLES", 1, int)
 
     # =============================================================================
     # VOLUME EXHAUSTION DETECTION
     # =============================================================================
 
     # Detect volume climax followed by declining volume
-    volume_climax_mult: float = field(
-        default_factory=lambda: float(os.getenv("BASKET_VOLUME_CLIMAX_MULT", "2.0"))
-    )
+    volume_climax_mult: float = _env_field("BASKET_VOLUME_CLIMAX_MULT", 2.0, float)
 
     # Consecutive declining volume periods to confirm exhaustion
-    exhaustion_decline_periods: int = field(
-        default_factory=lambda: int(os.getenv("BASKET_EXHAUSTION_PERIODS", "3"))
-    )
+    exhaustion_decline_periods: int = _env_field("BASKET_EXHAUSTION_PERIODS", 3, int)
 
     # =============================================================================
     # DYNAMIC POSITION SIZING (Story 5.10)
@@ -800,50 +811,27 @@ class BasketConfig:
     # Position sizes scale with portfolio value
 
     # Default position size as % of portfolio (e.g., 8% = $800 on $10K portfolio)
-    position_size_pct: float = field(
-        default_factory=lambda: float(os.getenv("BASKET_POSITION_SIZE_PCT", "8.0"))
-    )
+    position_size_pct: float = _env_field("BASKET_POSITION_SIZE_PCT", 8.0, float)
 
     # Minimum position size in USD (avoid dust trades)
-    min_position_usd: float = field(
-        default_factory=lambda: float(os.getenv("BASKET_MIN_POSITION_USD", "50.0"))
-    )
+    min_position_usd: float = _env_field("BASKET_MIN_POSITION_USD", 50.0, float)
 
     # Maximum position size in USD (risk limit, even for large portfolios)
-    max_position_usd: float = field(
-        default_factory=lambda: float(os.getenv("BASKET_MAX_POSITION_USD", "5000.0"))
-    )
+    max_position_usd: float = _env_field("BASKET_MAX_POSITION_USD", 5000.0, float)
 
     # Include open position value in portfolio calculation
-    include_open_positions: bool = field(
-        default_factory=lambda: os.getenv("BASKET_INCLUDE_POSITIONS", "true").lower() == "true"
-    )
+    include_open_positions: bool = _env_field("BASKET_INCLUDE_POSITIONS", True, _parse_bool)
 
     def validate(self) -> None:
         """Validate basket configuration values."""
-        if not (1 <= self.max_positions <= 20):
-            raise ValueError(f"max_positions must be 1-20, got {self.max_positions}")
+        _check_bounds(self, _BASKET_BOUNDS)
         if not (0 <= self.min_positions <= self.max_positions):
             raise ValueError(f"min_positions must be 0-{self.max_positions}")
-        if not (5.0 <= self.max_single_position_pct <= 50.0):
-            raise ValueError(f"max_single_position_pct must be 5-50%")
-        if not (0.3 <= self.max_correlation <= 1.0):
-            raise ValueError(f"max_correlation must be 0.3-1.0")
-        # Story 5.11: Relaxed thresholds for trend-confirmed pullback trading
-        if not (10 <= self.fear_threshold_buy <= 60):
-            raise ValueError(f"fear_threshold_buy must be 10-60")
-        if not (60 <= self.greed_threshold_sell <= 90):
-            raise ValueError(f"greed_threshold_sell must be 60-90")
-        # Position sizing validation
-        if not (1.0 <= self.position_size_pct <= 25.0):
-            raise ValueError(f"position_size_pct must be 1-25%, got {self.position_size_pct}")
-        if not (10.0 <= self.min_position_usd <= 500.0):
-            raise ValueError(f"min_position_usd must be $10-$500")
         if self.max_position_usd < self.min_position_usd:
             raise ValueError(f"max_position_usd must be >= min_position_usd")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScaleConfig:
     """
     Position scaling configuration (Story 5.4).
@@ -856,72 +844,70 @@ class ScaleConfig:
     """
 
     # Number of scale levels
-    num_scale_in_levels: int = field(
-        default_factory=lambda: int(os.getenv("NUM_SCALE_IN_LEVELS", "3"))
-    )
-    num_scale_out_levels: int = field(
-        default_factory=lambda: int(os.getenv("NUM_SCALE_OUT_LEVELS", "3"))
-    )
+    num_scale_in_levels: int = _env_field("NUM_SCALE_IN_LEVELS", 3, int)
+    num_scale_out_levels: int = _env_field("NUM_SCALE_OUT_LEVELS", 3, int)
 
     # Scale-in allocation percentages (must sum to 100)
-    scale_in_pct_1: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_IN_PCT_1", "33.33"))
-    )
-    scale_in_pct_2: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_IN_PCT_2", "33.33"))
-    )
-    scale_in_pct_3: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_IN_PCT_3", "33.34"))
-    )
+    scale_in_pct_1: float = _env_field("SCALE_IN_PCT_1", 33.33, float)
+    scale_in_pct_2: float = _env_field("SCALE_IN_PCT_2", 33.33, float)
+    scale_in_pct_3: float = _env_field("SCALE_IN_PCT_3", 33.34, float)
 
     # Scale-in trigger levels (% below first entry)
-    scale_in_drop_2: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_IN_DROP_2", "5.0"))
-    )  # 5% drop triggers scale 2
-    scale_in_drop_3: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_IN_DROP_3", "10.0"))
-    )  # 10% drop triggers scale 3 (capitulation)
+    scale_in_drop_2: float = _env_field("SCALE_IN_DROP_2", 5.0, float)  # 5% drop triggers scale 2
+    # 10% drop triggers scale 3 (capitulation)
+    scale_in_drop_3: float = _env_field("SCALE_IN_DROP_3", 10.0, float)
 
     # Scale-out allocation percentages
-    scale_out_pct_1: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_OUT_PCT_1", "33.33"))
-    )
-    scale_out_pct_2: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_OUT_PCT_2", "33.33"))
-    )
-    scale_out_pct_3: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_OUT_PCT_3", "33.34"))
-    )
+    scale_out_pct_1: float = _env_field("SCALE_OUT_PCT_1", 33.33, float)
+    scale_out_pct_2: float = _env_field("SCALE_OUT_PCT_2", 33.33, float)
+    scale_out_pct_3: float = _env_field("SCALE_OUT_PCT_3", 33.34, float)
 
     # Scale-out profit targets (% above average entry)
-    scale_out_profit_1: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_OUT_PROFIT_1", "10.0"))
-    )  # 10% profit = first exit
-    scale_out_profit_2: float = field(
-        default_factory=lambda: float(os.getenv("SCALE_OUT_PROFIT_2", "20.0"))
-    )  # 20% profit = second exit
+    # 10% profit = first exit
+    scale_out_profit_1: float = _env_field("SCALE_OUT_PROFIT_1", 10.0, float)
+    # 20% profit = second exit
+    scale_out_profit_2: float = _env_field("SCALE_OUT_PROFIT_2", 20.0, float)
     # scale_out_3 is trailing stop or extended target
 
     # Timeout for pending scales (hours)
-    scale_timeout_hours: int = field(
-        default_factory=lambda: int(os.getenv("SCALE_TIMEOUT_HOURS", "168"))
-    )  # 7 days default
-
-    def get_scale_in_percentages(self) -> List[float]:
-        """Get list of scale-in percentages."""
-        return [self.scale_in_pct_1, self.scale_in_pct_2, self.scale_in_pct_3]
-
-    def get_scale_out_percentages(self) -> List[float]:
-        """Get list of scale-out percentages."""
-        return [self.scale_out_pct_1, self.scale_out_pct_2, self.scale_out_pct_3]
-
-    def get_scale_in_drop_triggers(self) -> List[float]:
-        """Get list of scale-in drop trigger percentages (0 for first scale)."""
-        return [0.0, self.scale_in_drop_2, self.scale_in_drop_3]
-
-    def get_scale_out_profit_triggers(self) -> List[float]:
-        """Get list of scale-out profit trigger percentages (0 for trailing)."""
-        return [self.scale_out_profit_1, self.scale_out_profit_2, 0.0]
+    scale_timeout_hours: int = _env_field("SCALE_TIMEOUT_HOURS", 168, int)  # 7 days default
+
+    # Per-level tuples, derived once in __post_init__
+    _scale_in_pcts: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _scale_out_pcts: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _scale_in_drops: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _scale_out_profits: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass, so bypass __setattr__ for the derived fields
+        object.__setattr__(self, "_scale_in_pcts", (
+            self.scale_in_pct_1, self.scale_in_pct_2, self.scale_in_pct_3,
+        ))
+        object.__setattr__(self, "_scale_out_pcts", (
+            self.scale_out_pct_1, self.scale_out_pct_2, self.scale_out_pct_3,
+        ))
+        object.__setattr__(self, "_scale_in_drops", (
+            0.0, self.scale_in_drop_2, self.scale_in_drop_3,
+        ))
+        object.__setattr__(self, "_scale_out_profits", (
+            self.scale_out_profit_1, self.scale_out_profit_2, 0.0,
+        ))
+
+    def get_scale_in_percentages(self) -> Tuple[float, ...]:
+        """Get scale-in percentages, one per level."""
+        return self._scale_in_pcts
+
+    def get_scale_out_percentages(self) -> Tuple[float, ...]:
+        """Get scale-out percentages, one per level."""
+        return self._scale_out_pcts
+
+    def get_scale_in_drop_triggers(self) -> Tuple[float, ...]:
+        """Get scale-in drop trigger percentages (0 for first scale)."""
+        return self._scale_in_drops
+
+    def get_scale_out_profit_triggers(self) -> Tuple[float, ...]:
+        """Get scale-out profit trigger percentages (0 for trailing)."""
+        return self._scale_out_profits
 
     def validate(self) -> None:
         """
@@ -957,7 +943,14 @@ class ScaleConfig:
             raise ValueError("Scale-out profit 2 must be greater than profit 1")
 
 
-@dataclass
+# (field, min, max, rule) ranges checked by TrendConfig.validate()
+_TREND_BOUNDS = (
+    ("adx_trend_threshold", 10, 40, "adx_trend_threshold must be 10-40"),
+    ("extreme_fear_threshold", 10, 35, "extreme_fear_threshold must be 10-35"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class TrendConfig:
     """
     Trend-Confirmed Pullback Trading configuration (Story 5.11).
@@ -976,129 +969,202 @@ class TrendConfig:
     # =============================================================================
 
     # EMA periods for trend identification
-    ema_fast: int = field(
-        default_factory=lambda: int(os.getenv("TREND_EMA_FAST", "20"))
-    )
-    ema_slow: int = field(
-        default_factory=lambda: int(os.getenv("TREND_EMA_SLOW", "50"))
-    )
+    ema_fast: int = _env_field("TREND_EMA_FAST", 20, int)
+    ema_slow: int = _env_field("TREND_EMA_SLOW", 50, int)
 
     # ADX threshold for trending vs ranging market
-    adx_trend_threshold: float = field(
-        default_factory=lambda: float(os.getenv("TREND_ADX_THRESHOLD", "25.0"))
-    )
+    adx_trend_threshold: float = _env_field("TREND_ADX_THRESHOLD", 25.0, float)
 
     # Swing point detection lookback (candles on each side)
-    swing_lookback: int = field(
-        default_factory=lambda: int(os.getenv("TREND_SWING_LOOKBACK", "5"))
-    )
+    swing_lookback: int = _env_field("TREND_SWING_LOOKBACK", 5, int)
 
     # =============================================================================
     # PULLBACK DETECTION
     # =============================================================================
 
     # RSI pullback zone for uptrend entries
-    pullback_rsi_min: float = field(
-        default_factory=lambda: float(os.getenv("TREND_PULLBACK_RSI_MIN", "40.0"))
-    )
-    pullback_rsi_max: float = field(
-        default_factory=lambda: float(os.getenv("TREND_PULLBACK_RSI_MAX", "55.0"))
-    )
+    pullback_rsi_min: float = _env_field("TREND_PULLBACK_RSI_MIN", 40.0, float)
+    pullback_rsi_max: float = _env_field("TREND_PULLBACK_RSI_MAX", 55.0, float)
 
     # Pullback depth thresholds (% from recent high)
-    min_pullback_depth: float = field(
-        default_factory=lambda: float(os.getenv("TREND_MIN_PULLBACK_DEPTH", "3.0"))
-    )
-    max_pullback_depth: float = field(
-        default_factory=lambda: float(os.getenv("TREND_MAX_PULLBACK_DEPTH", "15.0"))
-    )
+    min_pullback_depth: float = _env_field("TREND_MIN_PULLBACK_DEPTH", 3.0, float)
+    max_pullback_depth: float = _env_field("TREND_MAX_PULLBACK_DEPTH", 15.0, float)
 
     # Price distance from EMA to consider "at support" (%)
-    ema_support_threshold: float = field(
-        default_factory=lambda: float(os.getenv("TREND_EMA_SUPPORT_PCT", "3.0"))
-    )
+    ema_support_threshold: float = _env_field("TREND_EMA_SUPPORT_PCT", 3.0, float)
 
     # Volume decline threshold to confirm healthy pullback (ratio)
-    volume_decline_threshold: float = field(
-        default_factory=lambda: float(os.getenv("TREND_VOLUME_DECLINE", "0.8"))
-    )
+    volume_decline_threshold: float = _env_field("TREND_VOLUME_DECLINE", 0.8, float)
 
     # =============================================================================
     # ENTRY WEIGHTING
     # =============================================================================
 
     # Strategy weights (should sum to 1.0)
-    trend_weight: float = field(
-        default_factory=lambda: float(os.getenv("TREND_STRATEGY_WEIGHT", "0.6"))
-    )  # 60% trend-following
-    contrarian_weight: float = field(
-        default_factory=lambda: float(os.getenv("CONTRARIAN_STRATEGY_WEIGHT", "0.4"))
-    )  # 40% contrarian
+    trend_weight: float = _env_field("TREND_STRATEGY_WEIGHT", 0.6, float)  # 60% trend-following
+    # 40% contrarian
+    contrarian_weight: float = _env_field("CONTRARIAN_STRATEGY_WEIGHT", 0.4, float)
 
     # =============================================================================
     # EXTREME CONTRARIAN FALLBACK
     # =============================================================================
 
     # Only trigger contrarian at extreme levels
-    extreme_fear_threshold: int = field(
-        default_factory=lambda: int(os.getenv("TREND_EXTREME_FEAR", "25"))
-    )
-    extreme_rsi_threshold: float = field(
-        default_factory=lambda: float(os.getenv("TREND_EXTREME_RSI", "30.0"))
-    )
+    extreme_fear_threshold: int = _env_field("TREND_EXTREME_FEAR", 25, int)
+    extreme_rsi_threshold: float = _env_field("TREND_EXTREME_RSI", 30.0, float)
 
     # Position size reduction for contrarian trades (multiplier)
-    contrarian_size_mult: float = field(
-        default_factory=lambda: float(os.getenv("TREND_CONTRARIAN_SIZE_MULT", "0.5"))
-    )  # Half size for contrarian
+    # Half size for contrarian
+    contrarian_size_mult: float = _env_field("TREND_CONTRARIAN_SIZE_MULT", 0.5, float)
 
     def validate(self) -> None:
         """Validate trend configuration values."""
         if self.ema_fast >= self.ema_slow:
             raise ValueError(f"ema_fast ({self.ema_fast}) must be < ema_slow ({self.ema_slow})")
 
-        if not (10 <= self.adx_trend_threshold <= 40):
-            raise ValueError(f"adx_trend_threshold must be 10-40, got {self.adx_trend_threshold}")
-
         if not (30 <= self.pullback_rsi_min < self.pullback_rsi_max <= 60):
             raise ValueError(f"Invalid RSI pullback range: {self.pullback_rsi_min}-{self.pullback_rsi_max}")
 
         if self.min_pullback_depth >= self.max_pullback_depth:
             raise ValueError(f"min_pullback_depth must be < max_pullback_depth")
 
-        if not (10 <= self.extreme_fear_threshold <= 35):
-            raise ValueError(f"extreme_fear_threshold must be 10-35, got {self.extreme_fear_threshold}")
+        _check_bounds(self, _TREND_BOUNDS)
 
 
-@dataclass
+def _lazy_section() -> Any:
+    """Declare a Config section that is built on first access."""
+    return field(init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Main application configuration."""
+    """
+    Main application configuration.
+
+    Sections that are validated at startup are built eagerly. The optional
+    integrations (LunarCrush, socials, Vertex/Gemini, on-chain, scanner) are
+    only built, and their env vars only read, when first accessed.
+    """
 
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
     kraken: KrakenConfig = field(default_factory=KrakenConfig)
-    lunarcrush: LunarCrushConfig = field(default_factory=LunarCrushConfig)
-    social: SocialConfig = field(default_factory=SocialConfig)
+    lunarcrush: LunarCrushConfig = _lazy_section()
+    social: SocialConfig = _lazy_section()
     scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
-    vertex_ai: VertexAIConfig = field(default_factory=VertexAIConfig)
-    gemini: GeminiConfig = field(default_factory=GeminiConfig)
-    gemini_vision: GeminiVisionConfig = field(default_factory=GeminiVisionConfig)
+    vertex_ai: VertexAIConfig = _lazy_section()
+    gemini: GeminiConfig = _lazy_section()
+    gemini_vision: GeminiVisionConfig = _lazy_section()
     risk: RiskConfig = field(default_factory=RiskConfig)
-    onchain: OnChainConfig = field(default_factory=OnChainConfig)
-    scanner: ScannerConfig = field(default_factory=ScannerConfig)
+    enhanced_risk: EnhancedRiskConfig = field(default_factory=EnhancedRiskConfig)
+    onchain: OnChainConfig = _lazy_section()
+    scanner: ScannerConfig = _lazy_section()
     multi_factor: MultiFactorConfig = field(default_factory=MultiFactorConfig)
     basket: BasketConfig = field(default_factory=BasketConfig)
+    scale: ScaleConfig = field(default_factory=ScaleConfig)
     trend: TrendConfig = field(default_factory=TrendConfig)
     trailing_stop: TrailingStopConfig = field(default_factory=TrailingStopConfig)
-    web_url: str = field(default_factory=lambda: os.getenv("WEB_URL", ""))
-    debug: bool = field(
-        default_factory=lambda: os.getenv("DEBUG", "").lower() == "true"
-    )
+    web_url: str = _env_field("WEB_URL", "")
+    debug: bool = _env_field("DEBUG", False, _parse_bool)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while a lazy section's slot is still empty
+        factory = _LAZY_SECTIONS.get(name)
+        if factory is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        section = factory()
+        object.__setattr__(self, name, section)
+        return section
 
 
-# Global configuration instance
-config = Config()
+_LAZY_SECTIONS: Dict[str, Callable[[], Any]] = {
+    "lunarcrush": LunarCrushConfig,
+    "social": SocialConfig,
+    "vertex_ai": VertexAIConfig,
+    "gemini": GeminiConfig,
+    "gemini_vision": GeminiVisionConfig,
+    "onchain": OnChainConfig,
+    "scanner": ScannerConfig,
+}
+
+
+def _validate_config(cfg: Config) -> None:
+    """
+    Run every section's validation once, when the config is first built.
+
+    Raises:
+        ValueError: If any section is misconfigured
+    """
+    cfg.kraken.validate_trading_credentials()
+    cfg.risk.validate()
+    cfg.enhanced_risk.validate()
+    cfg.trailing_stop.validate()
+    cfg.multi_factor.validate()
+    cfg.basket.validate()
+    cfg.scale.validate()
+    cfg.trend.validate()
+
+
+# Global configuration instance, created and validated on first use
+_config: Optional[Config] = None
 
 
 def get_config() -> Config:
-    """Get the global configuration instance."""
-    return config
+    """
+    Get the global configuration instance.
+
+    Built and validated on first use; the frozen instance is shared for the
+    rest of the process.
+
+    Raises:
+        ValueError: If any section fails validation
+    """
+    global _config
+    if _config is None:
+        cfg = Config()
+        _validate_config(cfg)
+        _config = cfg
+    return _config
+
+
+def reset_config_cache() -> None:
+    """
+    Drop the shared config and everything built from it.
+
+    The next get_config() re-reads the environment; the Gemini model
+    factories rebuild their models. Intended for tests.
+    """
+    global _config, _genai_api_key
+    _config = None
+    _genai_api_key = None
+    _build_model.cache_clear()
+
+
+__all__ = [
+    "Config",
+    "DatabaseConfig",
+    "KrakenConfig",
+    "LunarCrushConfig",
+    "SocialConfig",
+    "SchedulerConfig",
+    "VertexAIConfig",
+    "GeminiConfig",
+    "GeminiVisionConfig",
+    "RiskConfig",
+    "EnhancedRiskConfig",
+    "OnChainConfig",
+    "ScannerConfig",
+    "MultiFactorConfig",
+    "BasketConfig",
+    "ScaleConfig",
+    "TrendConfig",
+    "TrailingStopConfig",
+    "get_config",
+    "reset_config_cache",
+    "to_async_url",
+    "get_env",
+    "load_genai",
+    "get_gemini_flash_model",
+    "get_gemini_pro_vision_model",
+]
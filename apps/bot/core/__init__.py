@@ -7,12 +7,15 @@ builder for the Council of AI Agents trading decision system.
 Story 2.1: LangGraph State Machine Setup
 """
 
-from core.graph import build_council_graph, get_council_graph
+from typing import Any
+
 from core.state import (
+    Action,
     CandleData,
     FinalDecision,
     GraphState,
     SentimentAnalysis,
+    Signal,
     TechnicalAnalysis,
     VisionAnalysis,
     create_initial_state,
@@ -20,14 +23,37 @@ from core.state import (
 
 __all__ = [
     # Graph builder functions
+    "ainvoke_council",
+    "ainvoke_council_batch",
     "build_council_graph",
     "get_council_graph",
+    "warmup_council_graph",
     # State types
+    "Action",
     "CandleData",
     "FinalDecision",
     "GraphState",
     "SentimentAnalysis",
+    "Signal",
     "TechnicalAnalysis",
     "VisionAnalysis",
     "create_initial_state",
 ]
+
+# Graph helpers are resolved on first use (PEP 562) so that importing core for
+# the state types does not load langgraph or the agent nodes.
+_GRAPH_EXPORTS = frozenset({
+    "ainvoke_council",
+    "ainvoke_council_batch",
+    "build_council_graph",
+    "get_council_graph",
+    "warmup_council_graph",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _GRAPH_EXPORTS:
+        from core import graph
+
+        return getattr(graph, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
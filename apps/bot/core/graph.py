@@ -8,11 +8,16 @@ This module defines and builds the LangGraph state machine that
 orchestrates the AI agents in the trading decision pipeline.
 
 Graph Flow (V2 - Token Optimized):
-    Start -> SentimentAgent -> TechnicalAgent -> [Conditional] -> MasterNode -> End
-                                                      |
+    Start -> SentimentAgent --+
+                              +-> AnalysisJoin -> [Conditional] -> MasterNode -> End
+    Start -> TechnicalAgent --+                        |
                                                (if potential BUY)
-                                                      v
-                                                VisionAgent
+                                                       v
+                                                 VisionAgent
+
+Sentiment and technical analysis have no data dependency on each other, so
+they run in the same LangGraph super-step. Each writes its own state key, so
+no reducer is needed for the fan-in; the join waits for both before routing.
 
 Vision is only called when sentiment + technical suggest a potential BUY,
 reducing token usage by ~90% (Vision sends chart images = 50K tokens each).
@@ -23,65 +28,103 @@ Usage:
     graph = build_council_graph()
     initial_state = create_initial_state(asset_symbol="SOLUSD", ...)
     final_state = graph.invoke(initial_state)
+
+    # or, from async code:
+    final_state = await ainvoke_council(initial_state)
 """
 
 import logging
-from typing import Any, Literal
+import threading
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
-from langgraph.graph import END, StateGraph
+from config import get_config
+from core.state import GraphState, node_cache_key
 
-from core.state import GraphState
-from nodes.master import master_node
-from nodes.sentiment import sentiment_node
-from nodes.technical import technical_node
-from nodes.vision import vision_node
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+    from langgraph.types import CachePolicy
+
+# langgraph and the agent node modules (which pull in the Gemini SDK) are
+# imported inside build_council_graph, so importing this module - or
+# create_initial_state via core - stays cheap until a graph is built.
 
 logger = logging.getLogger(__name__)
 
+# How long an agent's result is reused for identical inputs. Covers duplicate
+# and adjacent runs (manual trigger next to a scheduled tick) without serving
+# analyses across a new candle: the cache key changes with the input window.
+NODE_CACHE_TTL_SECONDS = 300
 
-def should_run_vision(state: GraphState) -> Literal["vision_agent", "master_node"]:
+
+def analysis_join(state: GraphState) -> Dict[str, Any]:
     """
-    Router function: Decide whether to run Vision agent.
+    Fan-in after the parallel sentiment and technical agents.
 
     Story 5.9: Token Optimization
 
-    Vision analysis is expensive (~50K tokens per chart image).
-    Only run Vision when sentiment + technical suggest a potential BUY:
-    - Fear score < 50 (some level of fear present)
-    - Technical signal is BULLISH or NEUTRAL (not BEARISH)
+    Decides once, with both analyses in hand, whether Vision should run.
+    Vision analysis is expensive (~50K tokens per chart image), so it only
+    runs when sentiment + technical suggest a convincing potential BUY:
+    - Fear score below config.gemini_vision.fear_threshold (default 40)
+    - Technical signal is BULLISH
+    - Technical strength >= config.gemini_vision.min_tech_strength (default 60)
 
-    This reduces Vision calls from ~240/day to ~20/day, saving ~11M tokens.
+    This reduces Vision calls from ~240/day to well under ~20/day.
 
     Args:
         state: Current graph state after sentiment + technical analysis
 
     Returns:
-        "vision_agent" if Vision should run, "master_node" to skip Vision
+        Dict with the run_vision flag read by should_run_vision
     """
+    vision_config = get_config().gemini_vision
     sentiment = state.get("sentiment_analysis") or {}
     technical = state.get("technical_analysis") or {}
     asset = state.get("asset_symbol", "UNKNOWN")
 
     fear_score = sentiment.get("fear_score", 50)
     tech_signal = technical.get("signal", "NEUTRAL")
+    tech_strength = technical.get("strength", 0)
 
     # Conditions for running Vision (potential BUY opportunity)
-    has_fear = fear_score < 50  # Some fear present
-    not_bearish = tech_signal != "BEARISH"  # Not actively bearish
-
-    if has_fear and not_bearish:
-        logger.info(
-            f"[Router] {asset}: Running Vision (fear={fear_score}, signal={tech_signal})"
-        )
-        return "vision_agent"
-    else:
-        logger.info(
-            f"[Router] {asset}: Skipping Vision (fear={fear_score}, signal={tech_signal}) - saving tokens"
-        )
-        return "master_node"
-
-
-def build_council_graph() -> Any:
+    has_fear = fear_score < vision_config.fear_threshold
+    bullish = tech_signal == "BULLISH"
+    strong = tech_strength >= vision_config.min_tech_strength
+    run_vision = has_fear and bullish and strong
+
+    decision = "Running Vision" if run_vision else "Skipping Vision"
+    logger.info(
+        f"[Router] {asset}: {decision} (fear={fear_score} < {vision_config.fear_threshold}, "
+        f"signal={tech_signal}, strength={tech_strength} >= {vision_config.min_tech_strength})"
+    )
+    return {"run_vision": run_vision}
+
+
+def should_run_vision(state: GraphState) -> Literal["vision_agent", "master_node"]:
+    """
+    Router function: route on the run_vision flag set by analysis_join.
+
+    Args:
+        state: Current graph state after analysis_join
+
+    Returns:
+        "vision_agent" if Vision should run, "master_node" to skip Vision
+    """
+    return "vision_agent" if state.get("run_vision") else "master_node"
+
+
+def _agent_cache_policy(input_field: str) -> "CachePolicy":
+    """Cache policy keyed on the state list an agent node analyses."""
+    from langgraph.types import CachePolicy
+
+    return CachePolicy(
+        key_func=partial(node_cache_key, input_field=input_field),
+        ttl=NODE_CACHE_TTL_SECONDS,
+    )
+
+
+def build_council_graph() -> "CompiledStateGraph":
     """
     Build the Council of Agents state graph.
 
@@ -92,8 +135,8 @@ def build_council_graph() -> Any:
         Compiled StateGraph ready for invocation
 
     Graph Structure (Token Optimized):
-        - Entry: sentiment_agent
-        - Flow: sentiment -> technical -> [conditional] -> master
+        - Entry: sentiment_agent and technical_agent, in parallel
+        - Flow: (sentiment, technical) -> analysis_join -> [conditional] -> master
         - Vision only runs if sentiment + technical suggest potential BUY
         - Exit: END after master_node
 
@@ -111,26 +154,47 @@ def build_council_graph() -> Any:
             ...
         })
     """
+    from langgraph.graph import END, START, StateGraph
+
+    from core.node_cache import NodeResultCache
+    from nodes.master import master_node
+    from nodes.sentiment import sentiment_node
+    from nodes.technical import technical_node
+    from nodes.vision import vision_node
+
     logger.info("Building Council of Agents state graph (token-optimized)...")
 
     # Create the state graph with GraphState type
     workflow = StateGraph(GraphState)
 
-    # Add nodes - each node is a function that processes state
-    workflow.add_node("sentiment_agent", sentiment_node)
+    # Add nodes - each node is a function that processes state.
+    # The LLM-backed analysis agents are cached on the input they read.
+    # technical_agent is local indicator math and master_node must make a
+    # fresh decision every run, so neither is cached.
+    workflow.add_node(
+        "sentiment_agent",
+        sentiment_node,
+        cache_policy=_agent_cache_policy("sentiment_data"),
+    )
     workflow.add_node("technical_agent", technical_node)
-    workflow.add_node("vision_agent", vision_node)
+    workflow.add_node(
+        "vision_agent",
+        vision_node,
+        cache_policy=_agent_cache_policy("candles_data"),
+    )
     workflow.add_node("master_node", master_node)
+    workflow.add_node("analysis_join", analysis_join)
 
-    # Define edges with conditional Vision execution
-    workflow.set_entry_point("sentiment_agent")
+    # Sentiment and Technical are independent - fan out from START
+    workflow.add_edge(START, "sentiment_agent")
+    workflow.add_edge(START, "technical_agent")
 
-    # Sentiment -> Technical (always)
-    workflow.add_edge("sentiment_agent", "technical_agent")
+    # Wait for both before routing
+    workflow.add_edge(["sentiment_agent", "technical_agent"], "analysis_join")
 
-    # Technical -> Conditional routing (Vision or skip to Master)
+    # Join -> Conditional routing (Vision or skip to Master)
     workflow.add_conditional_edges(
-        "technical_agent",
+        "analysis_join",
         should_run_vision,
         {
             "vision_agent": "vision_agent",
@@ -145,57 +209,19 @@ def build_council_graph() -> Any:
     workflow.add_edge("master_node", END)
 
     # Compile the graph
-    compiled_graph = workflow.compile()
+    compiled_graph = workflow.compile(cache=NodeResultCache())
 
-    logger.info("Council graph compiled successfully (Vision conditional)")
+    logger.info("Council graph compiled successfully (parallel analysis, Vision conditional)")
 
     return compiled_graph
 
 
-# Future V2: Parallel execution pattern
-# This pattern allows Sentiment, Technical, and Vision agents to run
-# concurrently since they are independent of each other.
-#
-# def build_council_graph_parallel() -> Any:
-#     """
-#     Build the Council graph with parallel agent execution.
-#
-#     In this version, the three analysis agents run in parallel,
-#     and MasterNode waits for all to complete before synthesizing.
-#
-#     This is more efficient but requires careful state management.
-#     """
-#     from langgraph.graph import START
-#
-#     workflow = StateGraph(GraphState)
-#
-#     # Add nodes
-#     workflow.add_node("sentiment_agent", sentiment_node)
-#     workflow.add_node("technical_agent", technical_node)
-#     workflow.add_node("vision_agent", vision_node)
-#     workflow.add_node("master_node", master_node)
-#
-#     # Parallel edges from START
-#     workflow.add_edge(START, "sentiment_agent")
-#     workflow.add_edge(START, "technical_agent")
-#     workflow.add_edge(START, "vision_agent")
-#
-#     # All converge to master_node
-#     workflow.add_edge("sentiment_agent", "master_node")
-#     workflow.add_edge("technical_agent", "master_node")
-#     workflow.add_edge("vision_agent", "master_node")
-#
-#     # Master exits
-#     workflow.add_edge("master_node", END)
-#
-#     return workflow.compile()
-
-
 # Cached compiled graph instance
-_council_graph = None
+_council_graph: Optional["CompiledStateGraph"] = None
+_council_graph_lock = threading.Lock()
 
 
-def get_council_graph() -> Any:
+def get_council_graph() -> "CompiledStateGraph":
     """
     Get the cached Council graph instance.
 
@@ -212,5 +238,66 @@ def get_council_graph() -> Any:
     """
     global _council_graph
     if _council_graph is None:
-        _council_graph = build_council_graph()
+        # Double-checked so concurrent first callers compile only once
+        with _council_graph_lock:
+            if _council_graph is None:
+                _council_graph = build_council_graph()
     return _council_graph
+
+
+def warmup_council_graph() -> None:
+    """
+    Compile the Council graph ahead of the first council cycle.
+
+    Imports the agent node modules and compiles the graph at startup so the
+    first scheduled or API-triggered run does not pay for it. No dry
+    invocation is made: master_node always calls Gemini, so a synthetic run
+    would spend tokens on every restart.
+    """
+    get_council_graph()
+
+
+async def ainvoke_council(state: GraphState) -> Dict[str, Any]:
+    """
+    Run the cached Council graph without blocking the event loop.
+
+    The node functions stay synchronous (they wrap blocking Gemini SDK
+    calls); under ainvoke LangGraph runs each one in the default executor,
+    so the parallel sentiment/technical branches overlap and callers such
+    as the scheduler and API routes keep serving other work meanwhile.
+
+    Args:
+        state: Initial state from create_initial_state()
+
+    Returns:
+        Final graph state
+    """
+    return await get_council_graph().ainvoke(state)
+
+
+async def ainvoke_council_batch(
+    states: List[GraphState],
+    max_concurrency: int = 4,
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Run the Council graph for several assets at once.
+
+    Uses the graph's abatch, so independent assets overlap their LLM calls
+    instead of running back to back. Concurrency is capped to stay inside
+    the Gemini rate limits.
+
+    Args:
+        states: Initial states, one per asset
+        max_concurrency: Maximum graph runs in flight at once
+
+    Returns:
+        Final states in input order; a run that raised is returned as its
+        exception so one failing asset does not abort the rest
+    """
+    if not states:
+        return []
+    return await get_council_graph().abatch(
+        states,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
@@ -0,0 +1,122 @@
+"""
+Bounded result cache for the Council's agent nodes.
+
+Story 2.1: LangGraph State Machine Setup
+
+LangGraph's InMemoryCache only drops an expired entry when that same key is
+read again. Agent cache keys change with every candle window, so entries
+would pile up for the life of the process. NodeResultCache sweeps expired
+entries on write, caps the entry count with LRU eviction, and refuses to
+store error or fallback results.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on cached agent results. Keys change with every candle window,
+# so without a bound the cache would grow for as long as the process runs.
+NODE_CACHE_MAX_ENTRIES = 256
+
+# Prefixes the agent nodes put on error and keyword-fallback results
+# (nodes/sentiment.py, nodes/vision.py). Those are not cached, so the next
+# run retries the LLM instead of reusing a degraded analysis.
+_DEGRADED_PREFIXES = ("Error during", "Fallback analysis")
+_DEGRADED_TEXT_FIELDS = ("summary", "description", "reasoning")
+
+
+def _is_degraded(writes: Sequence[Any]) -> bool:
+    """True if a node's writes carry an error or fallback analysis."""
+    for channel, value in writes:
+        if channel == "error":
+            return True
+        if isinstance(value, dict) and any(
+            str(value.get(field) or "").startswith(_DEGRADED_PREFIXES)
+            for field in _DEGRADED_TEXT_FIELDS
+        ):
+            return True
+    return False
+
+
+class NodeResultCache(BaseCache):
+    """
+    Bounded LRU cache for agent node results.
+
+    Args:
+        maxsize: Entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, maxsize: int = NODE_CACHE_MAX_ENTRIES):
+        super().__init__()
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[FullKey, tuple[str, bytes, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, keys: Sequence[FullKey]) -> Dict[FullKey, Any]:
+        now = time.time()
+        values: Dict[FullKey, Any] = {}
+        with self._lock:
+            for full_key in keys:
+                entry = self._entries.get(full_key)
+                if entry is None:
+                    continue
+                enc, data, expiry = entry
+                if expiry is not None and now >= expiry:
+                    del self._entries[full_key]
+                    continue
+                self._entries.move_to_end(full_key)
+                values[full_key] = self.serde.loads_typed((enc, data))
+        return values
+
+    async def aget(self, keys: Sequence[FullKey]) -> Dict[FullKey, Any]:
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        now = time.time()
+        with self._lock:
+            expired = [
+                full_key for full_key, (_, _, expiry) in self._entries.items()
+                if expiry is not None and now >= expiry
+            ]
+            for full_key in expired:
+                del self._entries[full_key]
+
+            for full_key, (writes, ttl) in pairs.items():
+                if _is_degraded(writes):
+                    continue
+                try:
+                    enc, data = self.serde.dumps_typed(writes)
+                except TypeError as e:
+                    # Failing to cache a result must never fail the council run
+                    logger.warning(f"[NodeCache] Not caching {full_key[0]}: {e}")
+                    continue
+                self._entries[full_key] = (
+                    enc, data, now + ttl if ttl is not None else None,
+                )
+                self._entries.move_to_end(full_key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        self.set(pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self._lock:
+            if namespaces is None:
+                self._entries.clear()
+                return
+            for full_key in [k for k in self._entries if k[0] in namespaces]:
+                del self._entries[full_key]
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self.clear(namespaces)
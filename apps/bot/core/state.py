@@ -8,18 +8,25 @@ This module defines the GraphState TypedDict that carries trading context
 between different AI agents in the decision-making pipeline.
 
 State Flow:
-    Start -> SentimentAgent -> TechnicalAgent -> VisionAgent -> MasterNode -> End
+    Start -> (SentimentAgent | TechnicalAgent) -> [VisionAgent] -> MasterNode -> End
 
-Each agent receives the full state, processes its designated fields,
-and passes the enriched state to the next agent in the pipeline.
+Each agent receives the full state and returns only its designated fields.
+Sentiment and technical run in parallel, so they must never write the same key.
 
 Story 5.1 adds market regime detection to prevent catching falling knives
 in downtrends. The regime is calculated from daily candles and affects
 the thresholds used in the Master Node decision logic.
 """
 
+import hashlib
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Literal, Optional, TypedDict
+
+# Closed vocabularies for agent outputs. Kept as string literals (not enums)
+# because they are stored in the database, sent to the web app as JSON and
+# embedded in LLM prompts verbatim; Literal still lets a type checker flag typos.
+Signal = Literal["BULLISH", "BEARISH", "NEUTRAL"]
+Action = Literal["BUY", "SELL", "HOLD"]
 
 
 class CandleData(TypedDict):
@@ -61,7 +68,7 @@ class TechnicalAnalysis(TypedDict):
         volume_delta: Volume change percentage vs average
         reasoning: Explanation of the technical analysis
     """
-    signal: str  # "BULLISH", "BEARISH", "NEUTRAL"
+    signal: Signal
     strength: int  # 0-100
     rsi: float
     sma_50: float
@@ -119,7 +126,7 @@ class FinalDecision(TypedDict):
         reasoning: Explanation of the decision rationale
         timestamp: UTC timestamp when decision was made
     """
-    action: str  # "BUY", "SELL", "HOLD"
+    action: Action
     confidence: int  # 0-100
     reasoning: str
     timestamp: datetime
@@ -141,7 +148,7 @@ class MultiFactorAnalysisState(TypedDict, total=False):
         confidence: Confidence percentage based on weighted factor scoring
         reasoning: Human-readable summary of the multi-factor analysis
     """
-    action: str
+    action: Action
     buy_factors_met: int
     sell_factors_met: int
     buy_factors_triggered: List[str]
@@ -200,6 +207,9 @@ class GraphState(TypedDict):
     # Multi-factor analysis (Story 5.3)
     multi_factor_analysis: Optional[MultiFactorAnalysisState]
 
+    # Set by the analysis join: whether the Vision agent should run (Story 5.9)
+    run_vision: Optional[bool]
+
     # Regime analysis (Story 5.1 - optional, for future integration)
     regime_analysis: Optional[Dict[str, Any]]
 
@@ -247,6 +257,57 @@ def create_initial_state(
         vision_analysis=None,
         final_decision=None,
         multi_factor_analysis=None,
+        run_vision=None,
         regime_analysis=None,
         error=None
     )
+
+
+def node_cache_key(state: GraphState, input_field: str) -> str:
+    """
+    Cache key for an agent node that reads one input list from the state.
+
+    Projects the state to (asset, row count, first row, last row) of
+    input_field rather than hashing the whole list: the lists are
+    time-ordered windows, so a new candle or sentiment entry changes the
+    ends, while an identical re-run (adjacent scheduler tick, manual run)
+    hashes the same.
+
+    Args:
+        state: Graph state passed to the node
+        input_field: State key the node analyses (e.g. "candles_data")
+
+    Returns:
+        Hex digest identifying the node's effective input
+    """
+    rows = state.get(input_field) or []
+    projection = (
+        state.get("asset_symbol"),
+        len(rows),
+        rows[0] if rows else None,
+        rows[-1] if rows else None,
+    )
+    return hashlib.blake2b(repr(projection).encode(), digest_size=16).hexdigest()
+
+
+def to_builtin(value: Any) -> Any:
+    """
+    Convert numpy scalars and arrays in a node output to plain Python types.
+
+    Indicator math hands back numpy values (np.float64, np.bool_) that look
+    like floats and bools but are rejected by LangGraph's msgpack serializer
+    when a node result is cached or checkpointed.
+
+    Args:
+        value: Node output, possibly nested dicts/lists
+
+    Returns:
+        The same structure with numpy values replaced by builtins
+    """
+    if isinstance(value, dict):
+        return {key: to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtin(item) for item in value]
+    if type(value).__module__ == "numpy" and hasattr(value, "tolist"):
+        return value.tolist()
+    return value
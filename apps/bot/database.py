@@ -7,25 +7,19 @@ connecting to the same PostgreSQL database as the Next.js frontend.
 Based on Story 1.3: Added async session maker for Kraken ingestion.
 """
 
-import os
+import logging
 from typing import AsyncGenerator
 
-from dotenv import load_dotenv
-from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
 
-# Load environment variables
-load_dotenv()
+from config import DatabaseConfig, get_env, to_async_url
 
-# Get database URL from environment
-DATABASE_URL = os.getenv("DATABASE_URL", "")
+logger = logging.getLogger(__name__)
 
-# Convert postgres:// to postgresql+asyncpg:// for async support
-if DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
-elif DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+# Get database URL from environment (.env loaded lazily by config),
+# converted to postgresql+asyncpg://
+DATABASE_URL = to_async_url(get_env("DATABASE_URL", ""))
 
 # Create async engine
 engine: AsyncEngine | None = None
@@ -40,11 +34,13 @@ def get_engine() -> AsyncEngine:
     if engine is None:
         if not DATABASE_URL:
             raise ValueError("DATABASE_URL environment variable is not set")
+        # DEBUG and DATABASE_POOL_SIZE are parsed by the typed config helpers
+        db_config = DatabaseConfig()
         engine = create_async_engine(
             DATABASE_URL,
-            echo=os.getenv("DEBUG", "").lower() == "true",
+            echo=db_config.debug,
             pool_pre_ping=True,
-            pool_size=10,  # Story 1.3: Connection pool configuration
+            pool_size=db_config.pool_size,  # Story 1.3: Connection pool configuration
             max_overflow=5,
         )
     return engine
@@ -76,14 +72,16 @@ async def init_db() -> None:
     Note: Schema migrations are handled by Prisma in the database package.
     """
     try:
-        engine = get_engine()
+        db_engine = get_engine()
         # Test connection
-        async with engine.begin() as conn:
+        async with db_engine.begin() as conn:
             await conn.run_sync(lambda _: None)
-        print("Database connection established")
+        logger.info("Database connection established")
     except Exception as e:
-        print(f"Warning: Could not connect to database: {e}")
-        print("Bot will continue without database connection")
+        logger.warning(
+            f"Could not connect to database: {e} - "
+            "bot will continue without database connection"
+        )
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -95,6 +93,5 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         async def get_items(session: AsyncSession = Depends(get_session)):
             ...
     """
-    engine = get_engine()
-    async with AsyncSession(engine) as session:
+    async with AsyncSession(get_engine()) as session:
         yield session
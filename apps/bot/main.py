@@ -10,18 +10,17 @@ Story 2.4: Added 15-minute Council cycle for automated decision-making (Paper Tr
 """
 
 import logging
-import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from config import get_config
-from core.graph import get_council_graph
+from config import get_config, get_env, load_genai
+from core.graph import ainvoke_council, warmup_council_graph
 from core.state import create_initial_state
 from database import init_db, get_session_maker
 from services.kraken import close_kraken_client, get_kraken_client
@@ -36,12 +35,10 @@ from services.data_loader import (
 )
 from services.session_logger import log_council_session, get_recent_sessions
 from services.risk_validator import get_risk_validator
-from services.execution import get_all_open_positions
+from services.execution import get_open_positions_with_symbols
+from services.opportunity_scanner import get_opportunity_scanner, run_opportunity_scan
 from api.routes import safety_router
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -59,6 +56,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     scheduler = get_scheduler()
 
     # Startup
+    if config.gemini.is_configured():
+        # Pay the slow google-generativeai import now, not on the first cycle
+        load_genai()
+
+    # Compile the council graph now rather than on the first cycle
+    warmup_council_graph()
+
     await init_db()
     scheduler.start()
     logger.info("Scheduler started")
@@ -94,12 +98,20 @@ app = FastAPI(
 )
 
 # Configure CORS for development
+# An unset WEB_URL is dropped (and duplicates collapsed) so the allow-list
+# only holds real origins.
+_CORS_ORIGINS = list(dict.fromkeys(
+    origin
+    for origin in (
+        "http://localhost:3000",  # Next.js development
+        get_env("WEB_URL", ""),  # Production web URL
+    )
+    if origin
+))
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # Next.js development
-        os.getenv("WEB_URL", ""),  # Production web URL
-    ],
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -226,15 +238,15 @@ async def get_ingestion_status() -> dict[str, Any]:
     Returns information about the scheduler and next run times.
     """
     scheduler = get_scheduler()
-    jobs = scheduler.get_jobs()
 
-    job_info = []
-    for job in jobs:
-        job_info.append({
+    job_info = [
+        {
             "id": job.id,
             "name": job.name,
             "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
-        })
+        }
+        for job in scheduler.get_jobs()
+    ]
 
     return {
         "scheduler_running": scheduler.running,
@@ -314,14 +326,10 @@ async def run_council_session(request: CouncilSessionRequest) -> CouncilSessionR
     Future Enhancement:
         - Load candles_data from database (Kraken OHLCV)
         - Load sentiment_data from database (LunarCrush/Social)
-        - Add async execution for better performance
     """
     logger.info(f"Council session requested for {request.asset_symbol}")
 
     try:
-        # Get the cached Council graph
-        council_graph = get_council_graph()
-
         # Create initial state
         # TODO: In future stories, load data from database instead of request
         initial_state = create_initial_state(
@@ -330,9 +338,8 @@ async def run_council_session(request: CouncilSessionRequest) -> CouncilSessionR
             sentiment_data=request.sentiment_data,
         )
 
-        # Run the graph (synchronous for now)
-        # TODO: Consider async execution in future stories
-        final_state = council_graph.invoke(initial_state)
+        # Run the graph off the event loop
+        final_state = await ainvoke_council(initial_state)
 
         logger.info(
             f"Council session completed for {request.asset_symbol}: "
@@ -378,9 +385,6 @@ async def test_council_graph() -> dict[str, Any]:
     logger.info("Council graph test initiated")
 
     try:
-        # Get the cached graph
-        council_graph = get_council_graph()
-
         # Create test state
         test_state = create_initial_state(
             asset_symbol="SOLUSD",
@@ -400,7 +404,7 @@ async def test_council_graph() -> dict[str, Any]:
         )
 
         # Run graph
-        result = council_graph.invoke(test_state)
+        result = await ainvoke_council(test_state)
 
         # Extract decision for response
         decision = result.get("final_decision", {})
@@ -485,9 +489,6 @@ async def manual_council_run(asset_symbol: str) -> dict[str, Any]:
     logger.info(f"Manual council run triggered for {asset_symbol}")
 
     try:
-        # Get the cached Council graph
-        council_graph = get_council_graph()
-
         # Get async session
         session_maker = get_session_maker()
         async with session_maker() as session:
@@ -518,7 +519,7 @@ async def manual_council_run(asset_symbol: str) -> dict[str, Any]:
             )
 
             # Run council
-            final_state = council_graph.invoke(initial_state)
+            final_state = await ainvoke_council(initial_state)
 
             # Log session (Paper Trading)
             council_session = await log_council_session(final_state, asset.id, session=session)
@@ -632,8 +633,6 @@ async def trigger_scanner() -> dict[str, Any]:
     Returns:
         Dict with scan results
     """
-    from services.opportunity_scanner import run_opportunity_scan, get_opportunity_scanner
-
     logger.info("Manual scanner run triggered via API")
 
     try:
@@ -687,8 +686,6 @@ async def get_scanner_results() -> dict[str, Any]:
 
     Returns cached results from the last scan.
     """
-    from services.opportunity_scanner import get_opportunity_scanner
-
     scanner = get_opportunity_scanner()
     result = scanner.get_last_scan_result()
 
@@ -726,6 +723,11 @@ async def get_scanner_results() -> dict[str, Any]:
 # Story 5.5: Risk Parameter Optimization - Risk Status API
 # =============================================================================
 
+# /api/risk/status is polled by the dashboard. The last response is reused
+# for a few seconds while the open positions and P&L inputs are unchanged.
+RISK_STATUS_CACHE_TTL_SECONDS = 3.0
+_risk_status_cache: Optional[tuple[float, tuple, dict[str, Any]]] = None
+
 
 @app.get("/api/risk/status")
 async def get_risk_status() -> dict[str, Any]:
@@ -745,6 +747,8 @@ async def get_risk_status() -> dict[str, Any]:
     Returns:
         Dict with risk status, metrics, alerts, and recommendations
     """
+    global _risk_status_cache
+
     logger.info("Risk status requested via API")
 
     try:
@@ -753,30 +757,22 @@ async def get_risk_status() -> dict[str, Any]:
         # Get current portfolio state
         session_maker = get_session_maker()
         async with session_maker() as session:
-            # Get open positions
-            open_trades = await get_all_open_positions(session)
+            # Get open positions with their asset symbols (single JOIN)
+            open_trades = await get_open_positions_with_symbols(session)
 
             # Calculate portfolio value and positions list
             positions = []
             total_value = 0.0
 
-            for trade in open_trades:
+            for trade, symbol in open_trades:
                 # Get current price for position value
                 # For simplicity, use entry_price * size as position value
                 position_value = float(trade.entry_price * trade.size)
                 total_value += position_value
 
-                # Get asset symbol
-                from models import Asset
-                from sqlmodel import select
-                asset_result = await session.execute(
-                    select(Asset).where(Asset.id == trade.asset_id)
-                )
-                asset = asset_result.scalar_one_or_none()
-
-                if asset:
+                if symbol:
                     positions.append({
-                        "symbol": asset.symbol,
+                        "symbol": symbol,
                         "value": position_value,
                         "trade_id": trade.id,
                     })
@@ -788,6 +784,21 @@ async def get_risk_status() -> dict[str, Any]:
             # Calculate daily P&L (simplified - would need trade history)
             daily_pnl = 0.0
 
+            cache_key = (
+                tuple(sorted(
+                    (p["trade_id"], p["symbol"], p["value"]) for p in positions
+                )),
+                round(daily_pnl, 2),
+                round(estimated_portfolio, 0),
+            )
+            now = time.monotonic()
+            if (
+                _risk_status_cache is not None
+                and _risk_status_cache[1] == cache_key
+                and now - _risk_status_cache[0] < RISK_STATUS_CACHE_TTL_SECONDS
+            ):
+                return _risk_status_cache[2]
+
             # Get risk status
             status = await validator.get_risk_status(
                 portfolio_value=estimated_portfolio,
@@ -796,7 +807,7 @@ async def get_risk_status() -> dict[str, Any]:
                 session=session,
             )
 
-            return {
+            response = {
                 "status": status.overall_risk_level.value,
                 "can_trade": status.can_trade,
                 "metrics": {
@@ -826,6 +837,8 @@ async def get_risk_status() -> dict[str, Any]:
                 "open_positions": len(positions),
                 "estimated_portfolio_value": estimated_portfolio,
             }
+            _risk_status_cache = (now, cache_key, response)
+            return response
 
     except Exception as e:
         logger.error(f"Failed to get risk status: {e}")
@@ -861,27 +874,20 @@ async def validate_trade_risk(
 
         session_maker = get_session_maker()
         async with session_maker() as session:
-            # Get open positions
-            open_trades = await get_all_open_positions(session)
+            # Get open positions with their asset symbols (single JOIN)
+            open_trades = await get_open_positions_with_symbols(session)
 
             # Calculate positions list
             positions = []
             total_value = 0.0
 
-            for trade in open_trades:
+            for trade, symbol in open_trades:
                 position_value = float(trade.entry_price * trade.size)
                 total_value += position_value
 
-                from models import Asset
-                from sqlmodel import select
-                asset_result = await session.execute(
-                    select(Asset).where(Asset.id == trade.asset_id)
-                )
-                asset = asset_result.scalar_one_or_none()
-
-                if asset:
+                if symbol:
                     positions.append({
-                        "symbol": asset.symbol,
+                        "symbol": symbol,
                         "value": position_value,
                     })
 
@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Index, Enum as SAEnum
 from sqlmodel import Field, SQLModel, Relationship
 
 from .base import generate_cuid, TradeStatus
@@ -28,6 +28,9 @@ class Trade(SQLModel, table=True):
     """
 
     __tablename__ = "Trade"
+    __table_args__ = (
+        Index("Trade_status_idx", "status"),
+    )
 
     id: str = Field(
         default_factory=generate_cuid,
@@ -18,7 +18,7 @@ ADX is CRITICAL for contrarian strategy:
 import logging
 from typing import Any, Dict
 
-from core.state import GraphState, TechnicalAnalysis
+from core.state import GraphState, TechnicalAnalysis, to_builtin
 from services.technical_indicators import (
     IndicatorSignal,
     analyze_all_indicators,
@@ -84,7 +84,7 @@ def technical_node(state: GraphState) -> Dict[str, Any]:
                     "volume_delta": round(volume_delta, 2),
                     "reasoning": f"Limited candle data ({len(candles)} < 200) - basic analysis only"
                 }
-                return {"technical_analysis": technical_analysis}
+                return {"technical_analysis": to_builtin(technical_analysis)}
             except Exception as e:
                 logger.error(f"[TechnicalAgent] Error in fallback analysis: {str(e)}")
 
@@ -104,8 +104,12 @@ def technical_node(state: GraphState) -> Dict[str, Any]:
         # Convert candles to list of dicts if necessary
         candle_list = candles if isinstance(candles, list) else list(candles)
 
+        # Build the columnar frame once; the indicators and the volume
+        # delta below all read from it.
+        df = candles_to_dataframe(candle_list)
+
         # Run comprehensive analysis with all enhanced indicators
-        analysis = analyze_all_indicators(candle_list)
+        analysis = analyze_all_indicators(df)
 
         # Map indicator signal to trading signal
         if analysis.overall_signal in [IndicatorSignal.STRONG_BULLISH, IndicatorSignal.BULLISH]:
@@ -123,7 +127,6 @@ def technical_node(state: GraphState) -> Dict[str, Any]:
             logger.warning(f"[TechnicalAgent] ADX indicates strong trend - dampening signal")
 
         # Calculate volume delta for backward compatibility
-        df = candles_to_dataframe(candle_list)
         volume_delta = calculate_volume_delta(df)
 
         technical_analysis = {
@@ -201,5 +204,6 @@ def technical_node(state: GraphState) -> Dict[str, Any]:
         # Note: We don't set state["error"] here since we return a dict
         # The error is captured in the reasoning field
 
-    # Return only the fields to update (LangGraph merge pattern)
-    return {"technical_analysis": technical_analysis}
+    # Return only the fields to update (LangGraph merge pattern).
+    # Indicator values can be numpy scalars; state must hold builtins.
+    return {"technical_analysis": to_builtin(technical_analysis)}
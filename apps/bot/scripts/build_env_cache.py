@@ -0,0 +1,53 @@
+"""
+Pre-build the environment cache used by config.py.
+
+Parses .env once and writes its values to _env_cache.py as a plain dict
+literal. With APP_ENV_CACHED=1, config loads that module (a .pyc after the
+first import) instead of parsing .env on every start.
+
+Re-run after editing .env. The generated file contains secrets and is
+git-ignored.
+
+Usage:
+    python -m scripts.build_env_cache [path/to/.env]
+"""
+
+import os
+import sys
+from pprint import pformat
+
+from dotenv import dotenv_values
+
+BOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(BOT_DIR, "_env_cache.py")
+
+
+def build_env_cache(env_path: str = ".env", cache_path: str = CACHE_PATH) -> int:
+    """
+    Write the parsed .env values to cache_path.
+
+    Args:
+        env_path: Path to the .env file to parse
+        cache_path: Output module path
+
+    Returns:
+        Number of variables written
+    """
+    # Keys without a value (bare "KEY" lines) are skipped, as load_dotenv does
+    values = {
+        key: value
+        for key, value in dotenv_values(env_path).items()
+        if value is not None
+    }
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write('"""Generated by scripts/build_env_cache.py - do not edit."""\n\n')
+        f.write(f"ENV = {pformat(values)}\n")
+
+    return len(values)
+
+
+if __name__ == "__main__":
+    env_path = sys.argv[1] if len(sys.argv) > 1 else ".env"
+    count = build_env_cache(env_path)
+    print(f"Wrote {count} variables to {CACHE_PATH}")
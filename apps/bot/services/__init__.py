@@ -29,6 +29,7 @@ from .execution import (
     has_open_position,
     get_open_position,
     get_all_open_positions,
+    get_open_positions_with_symbols,
     close_position,
     execute_buy_scaled,
     setup_scaled_exit,
@@ -93,6 +94,7 @@ from .scheduler import (
     run_position_check,
     get_active_assets,
     upsert_candle,
+    upsert_candles,
 )
 from .position_manager import (
     ExitReason,
@@ -130,6 +132,7 @@ from .safety import (
     check_drawdown,
     get_portfolio_value,
     get_open_positions_value,
+    get_safety_snapshot,
     # Emergency
     enforce_max_drawdown,
     liquidate_all,
@@ -153,6 +156,7 @@ __all__ = [
     "has_open_position",
     "get_open_position",
     "get_all_open_positions",
+    "get_open_positions_with_symbols",
     "close_position",
     "execute_buy_scaled",
     "setup_scaled_exit",
@@ -210,6 +214,7 @@ __all__ = [
     "run_position_check",
     "get_active_assets",
     "upsert_candle",
+    "upsert_candles",
     # Position Manager (Story 3.3)
     "ExitReason",
     "get_open_positions",
@@ -241,6 +246,7 @@ __all__ = [
     "check_drawdown",
     "get_portfolio_value",
     "get_open_positions_value",
+    "get_safety_snapshot",
     "enforce_max_drawdown",
     "liquidate_all",
     "send_emergency_notification",
@@ -18,7 +18,8 @@ import os
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 class AssetTier(str, Enum):
@@ -37,11 +38,13 @@ class AssetTier(str, Enum):
     EXCLUDED = "EXCLUDED"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TierConfig:
     """
     Configuration for a specific asset tier.
 
+    Frozen like the settings in config.py; tiers are fixed at import.
+
     Attributes:
         max_allocation_percent: Maximum portfolio allocation percentage for this tier
         min_volume_24h: Minimum 24h trading volume in USD required for this tier
@@ -117,10 +120,18 @@ def get_tier_3_assets() -> List[str]:
     Returns:
         List of asset symbols in Tier 3, or empty list if not configured
     """
-    assets_str = os.getenv("TIER_3_ASSETS", "")
-    if not assets_str:
-        return []
-    return [a.strip().upper() for a in assets_str.split(",") if a.strip()]
+    return list(_parse_asset_list(os.getenv("TIER_3_ASSETS", "")))
+
+
+@lru_cache(maxsize=8)
+def _parse_asset_list(assets_str: str) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated symbol list, memoized per raw env value.
+
+    The env var is still read on every call, so runtime changes apply;
+    only the split/strip/upper work is shared.
+    """
+    return tuple(a.strip().upper() for a in assets_str.split(",") if a.strip())
 
 
 def get_full_asset_universe() -> List[str]:
@@ -168,7 +179,7 @@ def get_asset_tier(symbol: str) -> AssetTier:
         return AssetTier.TIER_2
 
     # Check Tier 3 (configurable via environment)
-    if symbol in get_tier_3_assets():
+    if symbol in _parse_asset_list(os.getenv("TIER_3_ASSETS", "")):
         return AssetTier.TIER_3
 
     # Unknown assets are excluded by default
@@ -53,15 +53,24 @@ async def load_candles_for_asset(
         session = session_maker()
 
     try:
-        # Query candles ordered by timestamp descending, then reverse for TA
+        # Query candles ordered by timestamp descending, then reverse for TA.
+        # Only the OHLCV columns are selected: plain rows skip building and
+        # identity-mapping a full Candle entity per row.
         statement = (
-            select(Candle)
+            select(
+                Candle.timestamp,
+                Candle.open,
+                Candle.high,
+                Candle.low,
+                Candle.close,
+                Candle.volume,
+            )
             .where(Candle.asset_id == asset_id)
             .order_by(Candle.timestamp.desc())
             .limit(limit)
         )
         result = await session.execute(statement)
-        candles = result.scalars().all()
+        candles = result.all()
 
         # Convert to dict format and reverse for oldest-first ordering
         candle_list = [
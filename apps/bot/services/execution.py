@@ -682,6 +682,35 @@ async def get_all_open_positions(
             return await _get(new_session)
 
 
+async def get_open_positions_with_symbols(
+    session: Optional[AsyncSession] = None,
+) -> list[Tuple[Trade, Optional[str]]]:
+    """
+    Get all open positions together with their asset symbols.
+
+    Story 5.5: Loads trades and symbols in one LEFT JOIN query instead of
+    one Asset lookup per trade.
+
+    Returns:
+        List of (Trade, symbol) tuples; symbol is None if the asset is missing
+    """
+    async def _get(s: AsyncSession) -> list[Tuple[Trade, Optional[str]]]:
+        statement = (
+            select(Trade, Asset.symbol)
+            .outerjoin(Asset, Asset.id == Trade.asset_id)
+            .where(Trade.status == TradeStatus.OPEN)
+        )
+        result = await s.execute(statement)
+        return [(trade, symbol) for trade, symbol in result.all()]
+
+    if session:
+        return await _get(session)
+    else:
+        session_maker = get_session_maker()
+        async with session_maker() as new_session:
+            return await _get(new_session)
+
+
 # =============================================================================
 # Scaled Execution Functions (Story 5.4)
 # =============================================================================
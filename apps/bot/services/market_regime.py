@@ -20,8 +20,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +72,53 @@ class RegimeAnalysis:
         }
 
 
+def _close_array(candles: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+    """
+    Extract candle closes as a float64 array.
+
+    Non-numeric closes are coerced to NaN, matching the previous
+    DataFrame-based behaviour.
+
+    Args:
+        candles: OHLCV candle dictionaries
+
+    Returns:
+        Array of closes, or None if no candle carries a 'close' field
+    """
+    if not any('close' in candle for candle in candles):
+        logger.warning("Candles data missing 'close' column")
+        return None
+
+    closes = pd.to_numeric(
+        pd.Series([candle.get('close') for candle in candles]),
+        errors='coerce',
+    )
+    return closes.to_numpy(dtype=np.float64)
+
+
+def _last_sma(closes: np.ndarray, period: int) -> Optional[float]:
+    """
+    Return the SMA of the trailing ``period`` closes.
+
+    Only the latest value is used by the regime filter, so the tail window
+    is averaged directly instead of materialising the full rolling series.
+
+    Args:
+        closes: Float64 close array
+        period: SMA period
+
+    Returns:
+        SMA value, or None if there is not enough data or the window has NaNs
+    """
+    if period <= 0 or len(closes) < period:
+        return None
+
+    value = float(closes[-period:].mean())
+    if np.isnan(value):
+        return None
+    return value
+
+
 def calculate_dma(
     candles: List[Dict[str, Any]],
     period: int = 200
@@ -79,7 +126,7 @@ def calculate_dma(
     """
     Calculate Daily Moving Average for given period.
 
-    Uses pandas_ta for accurate SMA calculation from OHLCV candle data.
+    Averages the trailing ``period`` closes of the OHLCV candle data.
 
     Args:
         candles: Daily OHLCV data (need period + buffer candles)
@@ -92,21 +139,26 @@ def calculate_dma(
         logger.warning(f"Insufficient candles for {period} DMA: have {len(candles)}")
         return None
 
-    df = pd.DataFrame(candles)
-
-    # Ensure close column exists and is numeric
-    if 'close' not in df.columns:
-        logger.warning("Candles data missing 'close' column")
+    closes = _close_array(candles)
+    if closes is None:
         return None
 
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
+    return _last_sma(closes, period)
 
-    sma = ta.sma(df['close'], length=period)
 
-    if sma is None or sma.empty or pd.isna(sma.iloc[-1]):
-        return None
+def _crossover_from_closes(
+    closes: np.ndarray,
+    fast_period: int,
+    slow_period: int
+) -> Tuple[bool, bool, float, float]:
+    """Compare the fast and slow SMAs of a close array."""
+    current_fast = _last_sma(closes, fast_period) or 0.0
+    current_slow = _last_sma(closes, slow_period) or 0.0
 
-    return float(sma.iloc[-1])
+    golden_cross = current_fast > current_slow
+    death_cross = current_fast < current_slow
+
+    return golden_cross, death_cross, current_fast, current_slow
 
 
 def detect_sma_crossover(
@@ -136,28 +188,11 @@ def detect_sma_crossover(
         logger.warning(f"Insufficient candles for crossover detection: have {len(candles)}, need {slow_period}")
         return False, False, 0.0, 0.0
 
-    df = pd.DataFrame(candles)
-
-    # Ensure close column exists and is numeric
-    if 'close' not in df.columns:
-        logger.warning("Candles data missing 'close' column")
-        return False, False, 0.0, 0.0
-
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
-
-    sma_fast = ta.sma(df['close'], length=fast_period)
-    sma_slow = ta.sma(df['close'], length=slow_period)
-
-    if sma_fast is None or sma_slow is None:
+    closes = _close_array(candles)
+    if closes is None:
         return False, False, 0.0, 0.0
 
-    current_fast = float(sma_fast.iloc[-1]) if not pd.isna(sma_fast.iloc[-1]) else 0.0
-    current_slow = float(sma_slow.iloc[-1]) if not pd.isna(sma_slow.iloc[-1]) else 0.0
-
-    golden_cross = current_fast > current_slow
-    death_cross = current_fast < current_slow
-
-    return golden_cross, death_cross, current_fast, current_slow
+    return _crossover_from_closes(closes, fast_period, slow_period)
 
 
 def classify_market_regime(
@@ -216,8 +251,11 @@ def classify_market_regime(
                 reasoning="Could not determine current price"
             )
 
+    # Extract closes once; the 200 DMA and the crossover share the array
+    closes = _close_array(candles)
+
     # Calculate 200 DMA
-    dma_200 = calculate_dma(candles, period=slow_period)
+    dma_200 = _last_sma(closes, slow_period) if closes is not None else None
 
     # Handle insufficient data
     if dma_200 is None:
@@ -234,8 +272,8 @@ def classify_market_regime(
         )
 
     # Detect crossover
-    golden_cross, death_cross, sma_50, sma_200 = detect_sma_crossover(
-        candles, fast_period=fast_period, slow_period=slow_period
+    golden_cross, death_cross, sma_50, sma_200 = _crossover_from_closes(
+        closes, fast_period, slow_period
     )
 
     # Calculate price position relative to 200 DMA
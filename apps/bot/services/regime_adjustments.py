@@ -44,6 +44,19 @@ class RegimeThresholds:
     reasoning: str
 
 
+def _override_or_env(
+    config: Dict[str, Any],
+    key: str,
+    env_key: str,
+    default: str,
+    cast: type,
+) -> Any:
+    """Return config[key] if overridden, else parse env_key (or default)."""
+    if key in config:
+        return config[key]
+    return cast(os.getenv(env_key, default))
+
+
 def get_regime_adjusted_thresholds(
     regime: MarketRegime,
     config: Optional[Dict[str, Any]] = None
@@ -73,13 +86,13 @@ def get_regime_adjusted_thresholds(
 
     if regime == MarketRegime.BULL:
         return {
-            "fear_threshold_buy": config.get(
-                "bull_fear_threshold",
-                int(os.getenv("REGIME_BULL_FEAR_THRESHOLD", "30"))
+            "fear_threshold_buy": _override_or_env(
+                config, "bull_fear_threshold",
+                "REGIME_BULL_FEAR_THRESHOLD", "30", int,
             ),
-            "position_size_multiplier": config.get(
-                "bull_position_multiplier",
-                float(os.getenv("REGIME_BULL_POSITION_MULT", "1.0"))
+            "position_size_multiplier": _override_or_env(
+                config, "bull_position_multiplier",
+                "REGIME_BULL_POSITION_MULT", "1.0", float,
             ),
             "require_vision_valid": True,
             "allow_trading": True,
@@ -89,13 +102,13 @@ def get_regime_adjusted_thresholds(
 
     elif regime == MarketRegime.BEAR:
         return {
-            "fear_threshold_buy": config.get(
-                "bear_fear_threshold",
-                int(os.getenv("REGIME_BEAR_FEAR_THRESHOLD", "20"))
+            "fear_threshold_buy": _override_or_env(
+                config, "bear_fear_threshold",
+                "REGIME_BEAR_FEAR_THRESHOLD", "20", int,
             ),
-            "position_size_multiplier": config.get(
-                "bear_position_multiplier",
-                float(os.getenv("REGIME_BEAR_POSITION_MULT", "0.5"))
+            "position_size_multiplier": _override_or_env(
+                config, "bear_position_multiplier",
+                "REGIME_BEAR_POSITION_MULT", "0.5", float,
             ),
             "require_vision_valid": True,
             "allow_trading": True,
@@ -105,13 +118,13 @@ def get_regime_adjusted_thresholds(
 
     else:  # CHOP
         return {
-            "fear_threshold_buy": config.get(
-                "chop_fear_threshold",
-                int(os.getenv("REGIME_CHOP_FEAR_THRESHOLD", "15"))
+            "fear_threshold_buy": _override_or_env(
+                config, "chop_fear_threshold",
+                "REGIME_CHOP_FEAR_THRESHOLD", "15", int,
             ),
-            "position_size_multiplier": config.get(
-                "chop_position_multiplier",
-                float(os.getenv("REGIME_CHOP_POSITION_MULT", "0.25"))
+            "position_size_multiplier": _override_or_env(
+                config, "chop_position_multiplier",
+                "REGIME_CHOP_POSITION_MULT", "0.25", float,
             ),
             "require_vision_valid": True,
             "allow_trading": True,  # Allow but with strict criteria
@@ -24,9 +24,9 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import AsyncIterator, Optional, Tuple
 
-from sqlmodel import select
+from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from database import get_session_maker
@@ -336,76 +336,93 @@ async def resume_trading(
 # =============================================================================
 
 
-async def get_portfolio_value(
-    session: Optional[AsyncSession] = None,
-) -> Tuple[float, dict]:
+async def iter_portfolio_value() -> AsyncIterator[Tuple[str, float, float]]:
     """
-    Calculate current total portfolio value.
+    Yield portfolio holdings one currency at a time.
 
-    Fetches all balances from Kraken and converts to USD.
+    Fetches all balances from Kraken and converts each to USD as it goes,
+    so callers can stream rows without waiting for every ticker lookup.
+    Currencies that cannot be priced are skipped.
 
-    Returns:
-        Tuple of (total_value_usd, breakdown_dict)
+    Yields:
+        Tuple of (currency, amount, value_usd)
+
+    Raises:
+        Exception: If the balance fetch fails
     """
     client = get_kraken_client()
+    await client.initialize()
 
-    try:
-        await client.initialize()
-
-        if client.exchange is None:
-            logger.error("Kraken exchange not initialized")
-            return 0.0, {}
+    if client.exchange is None:
+        logger.error("Kraken exchange not initialized")
+        return
 
-        # Fetch all balances
-        balances = await client.exchange.fetch_balance()
+    # Fetch all balances
+    balances = await client.exchange.fetch_balance()
 
-        total_usd = 0.0
-        breakdown = {}
+    for currency, balance_info in balances.items():
+        if currency in ['info', 'free', 'used', 'total', 'debt', 'timestamp', 'datetime']:
+            continue
 
-        for currency, balance_info in balances.items():
-            if currency in ['info', 'free', 'used', 'total', 'debt', 'timestamp', 'datetime']:
-                continue
+        if not isinstance(balance_info, dict):
+            continue
 
-            if not isinstance(balance_info, dict):
-                continue
+        amount = balance_info.get('total', 0)
+        if amount is None or amount <= 0:
+            continue
 
-            amount = balance_info.get('total', 0)
-            if amount is None or amount <= 0:
-                continue
-
-            # Convert to USD
-            if currency in ('USD', 'ZUSD'):
-                value_usd = float(amount)
-            else:
-                # Fetch ticker for conversion
+        # Convert to USD
+        if currency in ('USD', 'ZUSD'):
+            value_usd = float(amount)
+        else:
+            # Fetch ticker for conversion
+            try:
+                # Handle Kraken's currency naming (e.g., XXBT for BTC)
+                base = currency
+                if base.startswith('X') and len(base) == 4:
+                    base = base[1:]
+                if base.startswith('Z') and len(base) == 4:
+                    base = base[1:]
+                if base == 'XBT':
+                    base = 'BTC'
+
+                symbol = f"{base}/USD"
+                ticker = await client.exchange.fetch_ticker(symbol)
+                price = ticker['last']
+                value_usd = float(amount) * price
+            except Exception:
+                # Try USDT pair as fallback
                 try:
-                    # Handle Kraken's currency naming (e.g., XXBT for BTC)
-                    base = currency
-                    if base.startswith('X') and len(base) == 4:
-                        base = base[1:]
-                    if base.startswith('Z') and len(base) == 4:
-                        base = base[1:]
-                    if base == 'XBT':
-                        base = 'BTC'
-
-                    symbol = f"{base}/USD"
+                    symbol = f"{base}/USDT"
                     ticker = await client.exchange.fetch_ticker(symbol)
                     price = ticker['last']
                     value_usd = float(amount) * price
                 except Exception:
-                    # Try USDT pair as fallback
-                    try:
-                        symbol = f"{base}/USDT"
-                        ticker = await client.exchange.fetch_ticker(symbol)
-                        price = ticker['last']
-                        value_usd = float(amount) * price
-                    except Exception:
-                        logger.debug(f"Cannot price {currency}, skipping")
-                        continue
+                    logger.debug(f"Cannot price {currency}, skipping")
+                    continue
+
+        yield currency, float(amount), value_usd
+
+
+async def get_portfolio_value(
+    session: Optional[AsyncSession] = None,
+) -> Tuple[float, dict]:
+    """
+    Calculate current total portfolio value.
 
+    Fetches all balances from Kraken and converts to USD.
+
+    Returns:
+        Tuple of (total_value_usd, breakdown_dict)
+    """
+    try:
+        total_usd = 0.0
+        breakdown = {}
+
+        async for currency, amount, value_usd in iter_portfolio_value():
             total_usd += value_usd
             breakdown[currency] = {
-                'amount': float(amount),
+                'amount': amount,
                 'value_usd': value_usd
             }
 
@@ -539,32 +556,116 @@ async def check_drawdown(
             return await _check(new_session)
 
 
+async def get_safety_snapshot(
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """
+    Read everything the safety status endpoint needs in one pass.
+
+    Replaces separate calls to get_system_status, get_system_config,
+    is_trading_enabled, check_drawdown and get_open_positions_value: the
+    SystemConfig row and the open position count come back from a single
+    query, and the Kraken portfolio fetch runs concurrently with it.
+
+    Unlike check_drawdown(), this is read-only and does not update
+    last_drawdown_check; that belongs to the enforce_max_drawdown() job.
+
+    Returns:
+        Dict with status, trading_enabled, current_value, initial_balance,
+        drawdown_pct, max_drawdown_pct and open_positions
+    """
+    open_count = (
+        select(func.count())
+        .select_from(Trade)
+        .where(Trade.status == TradeStatus.OPEN)
+        .scalar_subquery()
+    )
+
+    async def _read(s: AsyncSession) -> Tuple[Optional[SystemConfig], int]:
+        result = await s.execute(
+            select(SystemConfig, open_count).where(SystemConfig.id == "system")
+        )
+        row = result.first()
+        if row is not None:
+            return row[0], int(row[1])
+
+        # No config row, so the count did not come back with it
+        result = await s.execute(select(open_count))
+        return None, int(result.scalar_one())
+
+    async def _read_with_session() -> Tuple[Optional[SystemConfig], int]:
+        if session:
+            return await _read(session)
+        session_maker = get_session_maker()
+        async with session_maker() as new_session:
+            return await _read(new_session)
+
+    (config, position_count), (current_value, _) = await asyncio.gather(
+        _read_with_session(),
+        get_portfolio_value(),
+    )
+
+    if config is None:
+        logger.error("SystemConfig not initialized! Returning PAUSED (fail safe)")
+        return {
+            "status": SystemStatus.PAUSED,
+            "trading_enabled": False,
+            "current_value": 0.0,
+            "initial_balance": 0.0,
+            "drawdown_pct": 0.0,
+            "max_drawdown_pct": 0.20,
+            "open_positions": position_count,
+        }
+
+    initial_balance = float(config.initial_balance)
+    drawdown_pct = 0.0
+    if initial_balance <= 0:
+        logger.error("Invalid initial balance for drawdown calculation")
+        current_value = 0.0
+    elif current_value > 0:
+        drawdown_pct = (initial_balance - current_value) / initial_balance
+
+    return {
+        "status": config.status,
+        "trading_enabled": (
+            config.status == SystemStatus.ACTIVE and config.trading_enabled
+        ),
+        "current_value": current_value,
+        "initial_balance": initial_balance,
+        "drawdown_pct": drawdown_pct,
+        "max_drawdown_pct": float(config.max_drawdown_pct),
+        "open_positions": position_count,
+    }
+
+
 # =============================================================================
 # Emergency Liquidation
 # =============================================================================
 
 
-async def liquidate_all(
+async def liquidate_all_stream(
     reason: str = "Emergency liquidation",
     session: Optional[AsyncSession] = None,
-) -> dict:
+) -> AsyncIterator[dict]:
     """
-    Emergency function to close ALL open positions immediately.
+    Close ALL open positions, yielding a progress event after each one.
 
-    This is the "nuclear option" - use with caution.
+    Same steps as liquidate_all(), but reports progress as it goes so
+    callers (e.g. the SSE liquidation endpoint) can show feedback while
+    a large book is being closed.
 
-    Steps:
-    1. Set system status to EMERGENCY_STOP
-    2. Fetch all open positions
-    3. Close each position with EMERGENCY exit reason
-    4. Log results
+    Events (the "event" key identifies the type):
+    - started: {"positions": int}
+    - closed: {"trade_id": str, "symbol": str, "pnl": float}
+    - failed: {"trade_id": str, "error": str}
+    - complete: {"summary": dict} - same shape as liquidate_all()
 
     Args:
         reason: Reason for liquidation (logged)
         session: Optional database session
 
-    Returns:
-        Summary dict of liquidation results
+    Yields:
+        Progress event dicts
     """
     logger.critical(f"LIQUIDATE_ALL TRIGGERED: {reason}")
 
@@ -576,7 +677,7 @@ async def liquidate_all(
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
-    async def _liquidate(s: AsyncSession) -> dict:
+    async def _liquidate(s: AsyncSession) -> AsyncIterator[dict]:
         # First, disable trading to prevent new positions
         await set_system_status(
             SystemStatus.EMERGENCY_STOP,
@@ -590,9 +691,12 @@ async def liquidate_all(
         )
         trades = list(result.scalars().all())
 
+        yield {"event": "started", "positions": len(trades)}
+
         if len(trades) == 0:
             logger.info("No open positions to liquidate")
-            return summary
+            yield {"event": "complete", "summary": summary}
+            return
 
         logger.warning(f"Liquidating {len(trades)} positions...")
 
@@ -614,11 +718,18 @@ async def liquidate_all(
                     summary["positions_closed"] += 1
                     # Get updated trade for P&L
                     await s.refresh(trade)
-                    if trade.pnl:
-                        summary["total_pnl"] += float(trade.pnl)
+                    pnl = float(trade.pnl) if trade.pnl else 0.0
+                    summary["total_pnl"] += pnl
+                    yield {
+                        "event": "closed",
+                        "trade_id": str(trade.id),
+                        "symbol": symbol,
+                        "pnl": pnl,
+                    }
                 else:
                     summary["positions_failed"] += 1
                     logger.error(f"Failed to liquidate {trade.id}: {error}")
+                    yield {"event": "failed", "trade_id": str(trade.id), "error": str(error)}
 
                 # Small delay to avoid rate limits
                 await asyncio.sleep(0.5)
@@ -626,6 +737,7 @@ async def liquidate_all(
             except Exception as e:
                 logger.error(f"Exception liquidating {trade.id}: {e}")
                 summary["positions_failed"] += 1
+                yield {"event": "failed", "trade_id": str(trade.id), "error": str(e)}
 
         logger.critical(
             f"LIQUIDATION COMPLETE: "
@@ -633,14 +745,45 @@ async def liquidate_all(
             f"P&L: ${summary['total_pnl']:.2f}"
         )
 
-        return summary
+        yield {"event": "complete", "summary": summary}
 
     if session:
-        return await _liquidate(session)
+        async for event in _liquidate(session):
+            yield event
     else:
         session_maker = get_session_maker()
         async with session_maker() as new_session:
-            return await _liquidate(new_session)
+            async for event in _liquidate(new_session):
+                yield event
+
+
+async def liquidate_all(
+    reason: str = "Emergency liquidation",
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """
+    Emergency function to close ALL open positions immediately.
+
+    This is the "nuclear option" - use with caution.
+
+    Steps:
+    1. Set system status to EMERGENCY_STOP
+    2. Fetch all open positions
+    3. Close each position with EMERGENCY exit reason
+    4. Log results
+
+    Args:
+        reason: Reason for liquidation (logged)
+        session: Optional database session
+
+    Returns:
+        Summary dict of liquidation results
+    """
+    summary: dict = {}
+    async for event in liquidate_all_stream(reason=reason, session=session):
+        if event["event"] == "complete":
+            summary = event["summary"]
+    return summary
 
 
 # =============================================================================
@@ -102,10 +102,11 @@ async def create_scaled_entry(
             f"target={total_tokens:.8f} tokens, {len(scale_pcts)} scales"
         )
 
+        entry_price = Decimal(str(first_entry_price))
+
         # Create scale orders
-        for i, pct in enumerate(scale_pcts, 1):
+        for i, (pct, drop_pct) in enumerate(zip(scale_pcts, drop_triggers), 1):
             scale_size = total_tokens * Decimal(str(pct)) / Decimal("100")
-            drop_pct = drop_triggers[i - 1]
 
             if i == 1:
                 # First scale - execute immediately
@@ -116,12 +117,12 @@ async def create_scaled_entry(
                 # Second scale - trigger on price drop
                 trigger_type = ScaleTriggerType.PRICE_DROP.value
                 trigger_pct = Decimal(str(drop_pct))
-                trigger_price = Decimal(str(first_entry_price)) * (1 - trigger_pct / 100)
+                trigger_price = entry_price * (1 - trigger_pct / 100)
             else:
                 # Third scale - capitulation level
                 trigger_type = ScaleTriggerType.CAPITULATION.value
                 trigger_pct = Decimal(str(drop_pct))
-                trigger_price = Decimal(str(first_entry_price)) * (1 - trigger_pct / 100)
+                trigger_price = entry_price * (1 - trigger_pct / 100)
 
             scale_order = ScaleOrder(
                 scaled_position_id=scaled_position.id,
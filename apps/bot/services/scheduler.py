@@ -108,58 +108,94 @@ async def get_quality_assets(session: AsyncSession) -> List[Asset]:
     return assets
 
 
-async def upsert_candle(
+# Rows per INSERT statement; 9 bind parameters per row stays well under the
+# asyncpg limit of 32767 parameters even for a full 720-candle backfill.
+_UPSERT_BATCH_SIZE = 1000
+
+
+async def upsert_candles(
     session: AsyncSession,
     asset_id: str,
-    candle_data: dict[str, Any],
-) -> bool:
+    candles: list[dict[str, Any]],
+) -> int:
     """
-    Upsert a single candle into the database.
+    Upsert a batch of candles with multi-row INSERT statements.
 
-    Uses PostgreSQL ON CONFLICT DO UPDATE to handle duplicates.
+    Uses PostgreSQL ON CONFLICT DO UPDATE to handle duplicates. Candles are
+    deduplicated on (timestamp, timeframe) first, keeping the last one, since
+    Postgres rejects a statement that updates the same row twice.
 
     Args:
         session: Database session
         asset_id: Asset ID from database
-        candle_data: Dict with timestamp, open, high, low, close, volume, timeframe
+        candles: Dicts with timestamp, open, high, low, close, volume, timeframe
 
     Returns:
-        True if upsert was successful
+        Number of candles upserted (0 on failure)
     """
     from sqlalchemy.dialects.postgresql import insert
     from models.base import generate_cuid
 
-    try:
-        stmt = insert(Candle).values(
-            id=generate_cuid(),  # Must provide ID for Prisma schema
-            asset_id=asset_id,
-            timestamp=candle_data["timestamp"],
-            timeframe=candle_data["timeframe"],
-            open=candle_data["open"],
-            high=candle_data["high"],
-            low=candle_data["low"],
-            close=candle_data["close"],
-            volume=candle_data["volume"],
-        )
+    unique = {
+        (candle_data["timestamp"], candle_data["timeframe"]): candle_data
+        for candle_data in candles
+    }
+    rows = [
+        {
+            "id": generate_cuid(),  # Must provide ID for Prisma schema
+            "asset_id": asset_id,
+            "timestamp": candle_data["timestamp"],
+            "timeframe": candle_data["timeframe"],
+            "open": candle_data["open"],
+            "high": candle_data["high"],
+            "low": candle_data["low"],
+            "close": candle_data["close"],
+            "volume": candle_data["volume"],
+        }
+        for candle_data in unique.values()
+    ]
 
-        # On conflict, update all price/volume fields
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["assetId", "timestamp", "timeframe"],
-            set_={
-                "open": stmt.excluded.open,
-                "high": stmt.excluded.high,
-                "low": stmt.excluded.low,
-                "close": stmt.excluded.close,
-                "volume": stmt.excluded.volume,
-            }
-        )
+    try:
+        for i in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            stmt = insert(Candle).values(rows[i:i + _UPSERT_BATCH_SIZE])
+
+            # On conflict, update all price/volume fields
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["assetId", "timestamp", "timeframe"],
+                set_={
+                    "open": stmt.excluded.open,
+                    "high": stmt.excluded.high,
+                    "low": stmt.excluded.low,
+                    "close": stmt.excluded.close,
+                    "volume": stmt.excluded.volume,
+                }
+            )
 
-        await session.execute(stmt)
-        return True
+            await session.execute(stmt)
+        return len(rows)
 
     except Exception as e:
-        logger.error(f"Failed to upsert candle for asset {asset_id}: {e}")
-        return False
+        logger.error(f"Failed to upsert candles for asset {asset_id}: {e}")
+        return 0
+
+
+async def upsert_candle(
+    session: AsyncSession,
+    asset_id: str,
+    candle_data: dict[str, Any],
+) -> bool:
+    """
+    Upsert a single candle into the database.
+
+    Args:
+        session: Database session
+        asset_id: Asset ID from database
+        candle_data: Dict with timestamp, open, high, low, close, volume, timeframe
+
+    Returns:
+        True if upsert was successful
+    """
+    return await upsert_candles(session, asset_id, [candle_data]) == 1
 
 
 async def update_asset_price(
@@ -222,18 +258,16 @@ async def ingest_single_asset(
             logger.warning(f"No candle data returned for {asset.symbol}")
             return False, 0
 
-        # Upsert each candle
-        upserted_count = 0
-        for candle_data in candles:
-            if await upsert_candle(session, asset.id, candle_data):
-                upserted_count += 1
+        # Upsert all candles in one statement
+        upserted_count = await upsert_candles(session, asset.id, candles)
 
-                # Update asset's last price
-                await update_asset_price(
-                    session,
-                    asset.id,
-                    candle_data["close"],
-                )
+        if upserted_count:
+            # Update asset's last price from the newest candle
+            await update_asset_price(
+                session,
+                asset.id,
+                candles[-1]["close"],
+            )
 
         return True, upserted_count
 
@@ -550,7 +584,7 @@ async def run_council_cycle() -> dict[str, Any]:
     Returns:
         Dict with cycle statistics
     """
-    from core.graph import get_council_graph
+    from core.graph import ainvoke_council_batch
     from core.state import create_initial_state
     from services.data_loader import (
         load_candles_for_asset,
@@ -674,9 +708,6 @@ async def run_council_cycle() -> dict[str, Any]:
     council_logger.info("[Cycle] Safety checks passed. Proceeding with cycle.")
 
     try:
-        # Get the cached Council graph
-        council_graph = get_council_graph()
-
         # Get async session
         session_maker = get_session_maker()
         async with session_maker() as session:
@@ -690,10 +721,13 @@ async def run_council_cycle() -> dict[str, Any]:
 
             council_logger.info(f"[Cycle] Processing {len(assets)} quality assets")
 
+            # Load data and build states one asset at a time - the shared
+            # session must not be used concurrently
+            pending = []
             for asset in assets:
                 # Story 5.2: Log tier information
                 tier = get_asset_tier(asset.symbol)
-                council_logger.info(f"\n[Cycle] Processing {asset.symbol} ({tier.value})...")
+                council_logger.info(f"\n[Cycle] Loading {asset.symbol} ({tier.value})...")
 
                 try:
                     # Load data for asset
@@ -719,10 +753,30 @@ async def run_council_cycle() -> dict[str, Any]:
                         candles_data=candles,
                         sentiment_data=sentiment,
                     )
+                    pending.append((asset, candles, initial_state))
 
-                    # Run council graph
-                    council_logger.info(f"[Cycle] Running council for {asset.symbol}...")
-                    final_state = council_graph.invoke(initial_state)
+                except Exception as e:
+                    error_msg = f"Error processing {asset.symbol}: {str(e)}"
+                    council_logger.error(f"[Cycle] {error_msg}")
+                    stats["errors"].append(error_msg)
+                    continue
+
+            # Run the councils concurrently; the LLM calls dominate cycle time
+            council_logger.info(
+                f"[Cycle] Running council for {len(pending)} assets "
+                f"(max {config.scheduler.council_concurrency} at once)..."
+            )
+            final_states = await ainvoke_council_batch(
+                [initial_state for _, _, initial_state in pending],
+                max_concurrency=config.scheduler.council_concurrency,
+            )
+
+            # Log and act on decisions in asset order, so basket capacity and
+            # open-position checks see the results of earlier orders
+            for (asset, candles, _), final_state in zip(pending, final_states):
+                try:
+                    if isinstance(final_state, Exception):
+                        raise final_state
 
                     # Log session to database
                     await log_council_session(final_state, asset.id, session=session)
@@ -21,13 +21,42 @@ All indicators return standardized signal format.
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 import pandas as pd
 import pandas_ta as ta
 
 logger = logging.getLogger(__name__)
 
+# Candle records, or the column frame built from them by _ohlcv_frame()
+Candles = Union[List[Dict[str, Any]], pd.DataFrame]
+
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _ohlcv_frame(candles: Candles) -> pd.DataFrame:
+    """
+    Column (one array per field) view of the candle records.
+
+    analyze_all_indicators builds this once and hands the same frame to every
+    indicator, instead of each one re-walking the list of dicts. A frame is
+    passed through as-is; indicators must not mutate it.
+
+    Args:
+        candles: OHLCV candle dicts, or a frame from a previous call
+
+    Returns:
+        DataFrame with numeric OHLCV columns
+    """
+    if isinstance(candles, pd.DataFrame):
+        return candles
+
+    df = pd.DataFrame(candles)
+    for col in _OHLCV_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
 
 class IndicatorSignal(str, Enum):
     """
@@ -69,7 +98,7 @@ class IndicatorResult:
 
 
 def calculate_macd(
-    candles: List[Dict[str, Any]],
+    candles: Candles,
     fast_period: int = 12,
     slow_period: int = 26,
     signal_period: int = 9
@@ -107,10 +136,7 @@ def calculate_macd(
             reasoning="Insufficient data for MACD calculation"
         )
 
-    df = pd.DataFrame(candles)
-
-    # Ensure close column is numeric
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
+    df = _ohlcv_frame(candles)
 
     macd = ta.macd(df['close'], fast=fast_period, slow=slow_period, signal=signal_period)
 
@@ -190,7 +216,7 @@ def calculate_macd(
 
 
 def calculate_bollinger_bands(
-    candles: List[Dict[str, Any]],
+    candles: Candles,
     period: int = 20,
     std_dev: float = 2.0
 ) -> IndicatorResult:
@@ -226,10 +252,7 @@ def calculate_bollinger_bands(
             reasoning="Insufficient data for Bollinger Bands"
         )
 
-    df = pd.DataFrame(candles)
-
-    # Ensure close column is numeric
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
+    df = _ohlcv_frame(candles)
 
     bb = ta.bbands(df['close'], length=period, std=std_dev)
 
@@ -341,7 +364,7 @@ def calculate_bollinger_bands(
 
 
 def calculate_obv(
-    candles: List[Dict[str, Any]],
+    candles: Candles,
     signal_period: int = 20
 ) -> IndicatorResult:
     """
@@ -373,11 +396,7 @@ def calculate_obv(
             reasoning="Insufficient data for OBV calculation"
         )
 
-    df = pd.DataFrame(candles)
-
-    # Ensure columns are numeric
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
-    df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
+    df = _ohlcv_frame(candles)
 
     obv = ta.obv(df['close'], df['volume'])
 
@@ -459,7 +478,7 @@ def calculate_obv(
 
 
 def calculate_adx(
-    candles: List[Dict[str, Any]],
+    candles: Candles,
     period: int = 14
 ) -> IndicatorResult:
     """
@@ -492,12 +511,7 @@ def calculate_adx(
             reasoning="Insufficient data for ADX calculation"
         )
 
-    df = pd.DataFrame(candles)
-
-    # Ensure columns are numeric
-    df['high'] = pd.to_numeric(df['high'], errors='coerce')
-    df['low'] = pd.to_numeric(df['low'], errors='coerce')
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
+    df = _ohlcv_frame(candles)
 
     adx_data = ta.adx(df['high'], df['low'], df['close'], length=period)
 
@@ -573,7 +587,7 @@ def calculate_adx(
 
 
 def calculate_vwap(
-    candles: List[Dict[str, Any]]
+    candles: Candles
 ) -> IndicatorResult:
     """
     Calculate VWAP (Volume Weighted Average Price).
@@ -602,19 +616,11 @@ def calculate_vwap(
             reasoning="Insufficient data for VWAP calculation"
         )
 
-    df = pd.DataFrame(candles)
-
-    # Ensure columns are numeric
-    df['high'] = pd.to_numeric(df['high'], errors='coerce')
-    df['low'] = pd.to_numeric(df['low'], errors='coerce')
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
-    df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
+    df = _ohlcv_frame(candles)
 
-    # VWAP requires DatetimeIndex
+    # VWAP requires DatetimeIndex (re-indexed copy; the shared frame is untouched)
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df.set_index('timestamp', inplace=True)
-        df = df.sort_index()
+        df = df.set_index(pd.to_datetime(df['timestamp'])).sort_index()
 
     # Try pandas_ta VWAP first
     vwap = ta.vwap(df['high'], df['low'], df['close'], df['volume'])
@@ -736,7 +742,7 @@ class ComprehensiveTechnicalAnalysis:
 
 
 def analyze_all_indicators(
-    candles: List[Dict[str, Any]]
+    candles: Candles
 ) -> ComprehensiveTechnicalAnalysis:
     """
     Run all technical indicators and aggregate signals.
@@ -755,16 +761,17 @@ def analyze_all_indicators(
     Returns:
         ComprehensiveTechnicalAnalysis with all indicators
     """
+    # Build the column frame once and share it across every indicator
+    df = _ohlcv_frame(candles)
+
     # Calculate all enhanced indicators
-    macd_result = calculate_macd(candles)
-    bollinger_result = calculate_bollinger_bands(candles)
-    obv_result = calculate_obv(candles)
-    adx_result = calculate_adx(candles)
-    vwap_result = calculate_vwap(candles)
+    macd_result = calculate_macd(df)
+    bollinger_result = calculate_bollinger_bands(df)
+    obv_result = calculate_obv(df)
+    adx_result = calculate_adx(df)
+    vwap_result = calculate_vwap(df)
 
     # Calculate existing indicators (RSI, SMA)
-    df = pd.DataFrame(candles)
-    df['close'] = pd.to_numeric(df['close'], errors='coerce')
 
     rsi = ta.rsi(df['close'], length=14)
     sma_50 = ta.sma(df['close'], length=50)
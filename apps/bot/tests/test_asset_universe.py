@@ -65,6 +65,15 @@ class TestTierConfig:
         assert config.min_market_cap == Decimal("10000000")
         assert config.assets == ["TESTASSET"]
 
+    def test_tier_config_is_frozen(self):
+        """Test TierConfig cannot be modified after creation."""
+        from dataclasses import FrozenInstanceError
+
+        config = DEFAULT_TIER_CONFIG[AssetTier.TIER_1]
+
+        with pytest.raises(FrozenInstanceError):
+            config.max_allocation_percent = Decimal("100.0")
+
 
 class TestDefaultTierConfig:
     """Tests for DEFAULT_TIER_CONFIG."""
@@ -164,6 +173,12 @@ class TestTier3Assets:
             assets = get_tier_3_assets()
             assert assets == ["AAVEUSD", "UNIUSD"]
 
+    def test_tier_3_list_is_a_fresh_copy(self):
+        """Test callers mutating the list do not affect later lookups."""
+        with patch.dict(os.environ, {"TIER_3_ASSETS": "AAVEUSD"}, clear=False):
+            get_tier_3_assets().append("DOGEUSD")
+            assert get_tier_3_assets() == ["AAVEUSD"]
+
     def test_tier_3_asset_is_tier_3(self):
         """Test configured Tier 3 asset is identified correctly."""
         with patch.dict(os.environ, {"TIER_3_ASSETS": "AAVEUSD"}, clear=False):
@@ -25,7 +25,7 @@ from services.data_loader import (
 
 @pytest.fixture
 def mock_candles():
-    """Create mock Candle objects."""
+    """Create mock candle rows (OHLCV columns by attribute)."""
     candles = []
     base_time = datetime.utcnow() - timedelta(hours=10)
 
@@ -80,7 +80,7 @@ class TestLoadCandlesForAsset:
         # Create mock session
         mock_session = AsyncMock()
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_candles
+        mock_result.all.return_value = mock_candles
         mock_session.execute.return_value = mock_result
 
         result = await load_candles_for_asset(
@@ -106,7 +106,7 @@ class TestLoadCandlesForAsset:
         """Test that Decimal values are converted to float."""
         mock_session = AsyncMock()
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_candles
+        mock_result.all.return_value = mock_candles
         mock_session.execute.return_value = mock_result
 
         result = await load_candles_for_asset(
@@ -137,7 +137,7 @@ class TestLoadCandlesForAsset:
         """Test that limit parameter is used in query."""
         mock_session = AsyncMock()
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_candles[:5]
+        mock_result.all.return_value = mock_candles[:5]
         mock_session.execute.return_value = mock_result
 
         result = await load_candles_for_asset(
@@ -154,7 +154,7 @@ class TestLoadCandlesForAsset:
         mock_session = AsyncMock()
         mock_result = MagicMock()
         # Return in descending order (newest first from DB)
-        mock_result.scalars.return_value.all.return_value = list(reversed(mock_candles))
+        mock_result.all.return_value = list(reversed(mock_candles))
         mock_session.execute.return_value = mock_result
 
         result = await load_candles_for_asset(
@@ -403,6 +403,46 @@ class TestGetAllOpenPositions:
         assert all(t.status == TradeStatus.OPEN for t in result)
 
 
+class TestGetOpenPositionsWithSymbols:
+    """Tests for get_open_positions_with_symbols function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_trades_with_symbols_in_one_query(self):
+        """Test trades and symbols come back from a single execute call."""
+        from services.execution import get_open_positions_with_symbols
+        from models import Trade, TradeStatus
+
+        trade = Trade(
+            id=str(uuid.uuid4()),
+            asset_id="asset-1",
+            status=TradeStatus.OPEN,
+            entry_price=Decimal("100.0"),
+            size=Decimal("10.0"),
+            entry_time=datetime.now(timezone.utc),
+            stop_loss_price=Decimal("95.0"),
+        )
+        orphan = Trade(
+            id=str(uuid.uuid4()),
+            asset_id="missing-asset",
+            status=TradeStatus.OPEN,
+            entry_price=Decimal("50.0"),
+            size=Decimal("20.0"),
+            entry_time=datetime.now(timezone.utc),
+            stop_loss_price=Decimal("45.0"),
+        )
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(trade, "SOLUSD"), (orphan, None)]
+
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        result = await get_open_positions_with_symbols(session=mock_session)
+
+        assert result == [(trade, "SOLUSD"), (orphan, None)]
+        mock_session.execute.assert_called_once()
+
+
 class TestExecuteBuyIntegration:
     """Integration-style tests for execute_buy."""
 
@@ -6,12 +6,21 @@ Story 2.1: LangGraph State Machine Setup
 Tests the StateGraph construction, compilation, and execution.
 """
 
-from datetime import datetime, timezone
+import math
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from core.graph import build_council_graph, get_council_graph
+from core.graph import (
+    ainvoke_council,
+    ainvoke_council_batch,
+    analysis_join,
+    build_council_graph,
+    get_council_graph,
+    should_run_vision,
+)
 from core.state import create_initial_state
 
 
@@ -36,6 +45,207 @@ class TestBuildCouncilGraph:
 
         assert type(graph1) == type(graph2)
 
+    def test_sentiment_and_technical_fan_out_from_start(self):
+        """Test the independent analysis agents run in parallel, then join."""
+        edges = {(e.source, e.target) for e in build_council_graph().get_graph().edges}
+
+        assert ("__start__", "sentiment_agent") in edges
+        assert ("__start__", "technical_agent") in edges
+        assert ("sentiment_agent", "analysis_join") in edges
+        assert ("technical_agent", "analysis_join") in edges
+        assert ("sentiment_agent", "technical_agent") not in edges
+
+    def test_vision_is_behind_conditional_router(self):
+        """Test only the token-optimized graph is built: Vision is a conditional branch."""
+        edges = {
+            (e.source, e.target): e.conditional
+            for e in build_council_graph().get_graph().edges
+        }
+
+        assert edges[("analysis_join", "vision_agent")] is True
+        assert edges[("analysis_join", "master_node")] is True
+        assert ("technical_agent", "vision_agent") not in edges
+
+
+class TestCouncilBatch:
+    """Tests for running the council over several assets at once."""
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_states_in_input_order(self):
+        """Test each asset gets its own final state, in order."""
+        states = [create_initial_state(asset_symbol=s) for s in ("SOLUSD", "BTCUSD")]
+
+        results = await ainvoke_council_batch(states, max_concurrency=2)
+
+        assert [r["asset_symbol"] for r in results] == ["SOLUSD", "BTCUSD"]
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_failures_in_place(self):
+        """Test one failing run is returned as its exception, not raised."""
+        graph = MagicMock()
+
+        async def fake_abatch(states, config, return_exceptions):
+            assert config == {"max_concurrency": 3}
+            assert return_exceptions is True
+            return [{"asset_symbol": "SOLUSD"}, RuntimeError("boom")]
+
+        graph.abatch = fake_abatch
+        with patch("core.graph.get_council_graph", return_value=graph):
+            results = await ainvoke_council_batch(
+                [create_initial_state(asset_symbol="SOLUSD")] * 2, max_concurrency=3,
+            )
+
+        assert results[0] == {"asset_symbol": "SOLUSD"}
+        assert isinstance(results[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test an empty cycle does not touch the graph."""
+        assert await ainvoke_council_batch([]) == []
+
+
+class TestVisionRouting:
+    """Tests for the join's run_vision flag and the router that reads it."""
+
+    def test_fear_and_strong_bullish_runs_vision(self):
+        """Test fear with a strong bullish signal flags Vision."""
+        state = create_initial_state(asset_symbol="SOLUSD")
+        state["sentiment_analysis"] = {"fear_score": 30, "summary": "", "source_count": 1}
+        state["technical_analysis"] = {"signal": "BULLISH", "strength": 70}
+
+        assert analysis_join(state) == {"run_vision": True}
+
+    def test_weak_or_neutral_signal_skips_vision(self):
+        """Test low-conviction technical signals skip Vision."""
+        state = create_initial_state(asset_symbol="SOLUSD")
+        state["sentiment_analysis"] = {"fear_score": 30, "summary": "", "source_count": 1}
+
+        state["technical_analysis"] = {"signal": "NEUTRAL", "strength": 90}
+        assert analysis_join(state) == {"run_vision": False}
+
+        state["technical_analysis"] = {"signal": "BULLISH", "strength": 40}
+        assert analysis_join(state) == {"run_vision": False}
+
+    def test_thresholds_come_from_config(self):
+        """Test the gate uses the configured fear and strength thresholds."""
+        import os
+
+        import config as config_module
+
+        state = create_initial_state(asset_symbol="SOLUSD")
+        state["sentiment_analysis"] = {"fear_score": 45, "summary": "", "source_count": 1}
+        state["technical_analysis"] = {"signal": "BULLISH", "strength": 50}
+
+        with patch.dict(os.environ, {"VISION_FEAR_THRESHOLD": "50",
+                                     "VISION_MIN_TECH_STRENGTH": "50"}), \
+             patch.object(config_module, "_config", None):
+            assert analysis_join(state) == {"run_vision": True}
+
+    def test_bearish_signal_skips_vision(self):
+        """Test a bearish technical signal skips Vision despite fear."""
+        state = create_initial_state(asset_symbol="SOLUSD")
+        state["sentiment_analysis"] = {"fear_score": 30, "summary": "", "source_count": 1}
+        state["technical_analysis"] = {"signal": "BEARISH"}
+
+        assert analysis_join(state) == {"run_vision": False}
+
+    def test_router_reads_flag_only(self):
+        """Test the router is a pure lookup of run_vision."""
+        assert should_run_vision({"run_vision": True}) == "vision_agent"
+        assert should_run_vision({"run_vision": False}) == "master_node"
+        assert should_run_vision({}) == "master_node"
+
+
+class TestAgentNodeCache:
+    """Tests for the per-agent result cache."""
+
+    _ENTRY = {"text": "BTC looking shaky", "source": "telegram"}
+
+    @staticmethod
+    def _sentiment_mock(summary: str = "mock"):
+        return MagicMock(return_value={"sentiment_analysis": {
+            "fear_score": 50, "summary": summary, "source_count": 1,
+        }})
+
+    def test_identical_inputs_reuse_agent_result(self):
+        """Test a repeat run with the same sentiment window skips the agent."""
+        sentiment = self._sentiment_mock()
+        with patch("nodes.sentiment.sentiment_node", sentiment):
+            graph = build_council_graph()
+        state = create_initial_state(asset_symbol="SOLUSD", sentiment_data=[self._ENTRY])
+
+        graph.invoke(state)
+        graph.invoke(state)
+
+        sentiment.assert_called_once()
+
+    def test_new_entry_misses_cache(self):
+        """Test a changed sentiment window re-runs the agent."""
+        sentiment = self._sentiment_mock()
+        with patch("nodes.sentiment.sentiment_node", sentiment):
+            graph = build_council_graph()
+
+        graph.invoke(create_initial_state(asset_symbol="SOLUSD", sentiment_data=[self._ENTRY]))
+        graph.invoke(create_initial_state(
+            asset_symbol="SOLUSD",
+            sentiment_data=[self._ENTRY, {**self._ENTRY, "text": "capitulation"}],
+        ))
+
+        assert sentiment.call_count == 2
+
+    def test_fallback_result_not_cached(self):
+        """Test a keyword-fallback analysis is retried on the next run."""
+        sentiment = self._sentiment_mock("Fallback analysis: NEUTRAL sentiment detected")
+        with patch("nodes.sentiment.sentiment_node", sentiment):
+            graph = build_council_graph()
+        state = create_initial_state(asset_symbol="SOLUSD", sentiment_data=[self._ENTRY])
+
+        graph.invoke(state)
+        graph.invoke(state)
+
+        assert sentiment.call_count == 2
+
+    def test_technical_agent_not_cached(self):
+        """Test the technical agent (no LLM call) runs on every invocation."""
+        technical = MagicMock(return_value={"technical_analysis": {
+            "signal": "BEARISH", "strength": 0, "rsi": 50.0, "sma_50": 0.0,
+            "sma_200": 0.0, "volume_delta": 0.0, "reasoning": "mock",
+        }})
+        with patch("nodes.technical.technical_node", technical):
+            graph = build_council_graph()
+        state = create_initial_state(asset_symbol="SOLUSD")
+
+        graph.invoke(state)
+        graph.invoke(state)
+
+        assert technical.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_real_technical_node_runs_through_compiled_graph(self):
+        """Test indicator output from the real technical node survives the graph."""
+        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        candles = []
+        for i in range(250):
+            price = 100.0 + 10.0 * math.sin(i / 9) + i * 0.05
+            candles.append({
+                "timestamp": start + timedelta(minutes=15 * i),
+                "open": price, "high": price + 1.0, "low": price - 1.0,
+                "close": price + 0.3, "volume": 1000.0 + (i % 7) * 50.0,
+            })
+
+        graph = build_council_graph()
+        result = await graph.ainvoke(
+            create_initial_state(asset_symbol="SOLUSD", candles_data=candles)
+        )
+
+        technical = result["technical_analysis"]
+        assert technical is not None
+        assert technical["signal"] in ("BULLISH", "BEARISH", "NEUTRAL")
+        # Everything the node wrote must be msgpack-serializable
+        JsonPlusSerializer(pickle_fallback=False).dumps_typed(technical)
+
 
 class TestGetCouncilGraph:
     """Tests for get_council_graph caching function."""
@@ -54,10 +264,37 @@ class TestGetCouncilGraph:
         # Should be the exact same object (cached)
         assert graph1 is graph2
 
+    def test_concurrent_first_calls_compile_once(self):
+        """Test racing first callers share a single compiled graph."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import core.graph as graph_module
+
+        with patch.object(graph_module, "_council_graph", None), \
+             patch.object(graph_module, "build_council_graph",
+                          side_effect=lambda: object()) as mock_build:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                graphs = list(pool.map(lambda _: get_council_graph(), range(16)))
+
+        mock_build.assert_called_once()
+        assert all(g is graphs[0] for g in graphs)
+
 
 class TestGraphInvocation:
     """Tests for graph invocation with test data."""
 
+    @pytest.mark.asyncio
+    async def test_ainvoke_council_matches_sync_invoke(self):
+        """Test the async entry point produces the same analyses as invoke."""
+        state = create_initial_state(asset_symbol="SOLUSD")
+
+        result = await ainvoke_council(state)
+
+        assert result["asset_symbol"] == "SOLUSD"
+        assert result["sentiment_analysis"] is not None
+        assert result["technical_analysis"] is not None
+        assert result["final_decision"] is not None
+
     def test_graph_invoke_minimal_state(self):
         """Test graph invocation with minimal state."""
         graph = build_council_graph()
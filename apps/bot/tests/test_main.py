@@ -113,6 +113,68 @@ class TestIngestionStatusEndpoint:
             assert result["jobs"][0]["name"] == "Kraken OHLCV Ingestion"
 
 
+class TestRiskStatusEndpoint:
+    """Tests for the /api/risk/status endpoint cache."""
+
+    @staticmethod
+    def _patches(positions):
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_cm.__aexit__ = AsyncMock(return_value=None)
+
+        validator = MagicMock()
+        validator.get_risk_status = AsyncMock(return_value=MagicMock())
+
+        return validator, (
+            patch("main.get_session_maker", return_value=MagicMock(return_value=session_cm)),
+            patch("main.get_open_positions_with_symbols", new_callable=AsyncMock, return_value=positions),
+            patch("main.get_risk_validator", return_value=validator),
+        )
+
+    @staticmethod
+    def _trade(trade_id: str, value: float) -> MagicMock:
+        trade = MagicMock()
+        trade.id = trade_id
+        trade.entry_price = value
+        trade.size = 1
+        return trade
+
+    @pytest.mark.asyncio
+    async def test_repeated_poll_reuses_status(self):
+        """Test an unchanged portfolio is served from the cache."""
+        import main
+
+        main._risk_status_cache = None
+        validator, patches = self._patches([(self._trade("t1", 100.0), "SOLUSD")])
+
+        with patches[0], patches[1], patches[2]:
+            first = await main.get_risk_status()
+            second = await main.get_risk_status()
+
+        assert first is second
+        validator.get_risk_status.assert_awaited_once()
+        main._risk_status_cache = None
+
+    @pytest.mark.asyncio
+    async def test_position_change_recomputes_status(self):
+        """Test a changed position set bypasses the cache."""
+        import main
+
+        main._risk_status_cache = None
+        validator, patches = self._patches([(self._trade("t1", 100.0), "SOLUSD")])
+
+        with patches[0], patches[1] as mock_positions, patches[2]:
+            await main.get_risk_status()
+            mock_positions.return_value = [
+                (self._trade("t1", 100.0), "SOLUSD"),
+                (self._trade("t2", 50.0), "ETHUSD"),
+            ]
+            await main.get_risk_status()
+
+        assert validator.get_risk_status.await_count == 2
+        main._risk_status_cache = None
+
+
 class TestKrakenConnectionEndpoint:
     """Tests for Kraken connection test endpoint."""
 
@@ -163,3 +225,29 @@ class TestKrakenConnectionEndpoint:
                 await test_kraken_connection()
 
             assert exc_info.value.status_code == 503
+
+
+class TestSafetyRouteErrors:
+    """Tests for unexpected errors raised by the safety routes."""
+
+    def test_error_response_keeps_cors_header_and_detail(self):
+        """Test a failing safety route returns a readable 500 to the dashboard."""
+        from fastapi.testclient import TestClient
+
+        from api.routes.safety import invalidate_status_cache
+        from main import app
+
+        invalidate_status_cache()
+        with patch(
+            "api.routes.safety.get_safety_snapshot",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("db down"),
+        ):
+            response = TestClient(app).get(
+                "/api/safety/status",
+                headers={"Origin": "http://localhost:3000"},
+            )
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Failed to get system status: db down"}
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
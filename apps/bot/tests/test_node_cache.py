@@ -0,0 +1,69 @@
+"""
+Tests for core/node_cache.py - bounded agent result cache.
+
+Story 2.1: LangGraph State Machine Setup
+"""
+
+from unittest.mock import patch
+
+from core.node_cache import NodeResultCache
+
+NS = ("sentiment_agent",)
+
+
+def _writes(summary: str = "ok"):
+    return [("sentiment_analysis", {"fear_score": 40, "summary": summary, "source_count": 1})]
+
+
+class TestNodeResultCache:
+    """Tests for NodeResultCache."""
+
+    def test_round_trip(self):
+        """Test a stored result is returned for its key."""
+        cache = NodeResultCache()
+        cache.set({(NS, "k1"): (_writes(), 300)})
+
+        cached = cache.get([(NS, "k1")])[(NS, "k1")]
+        assert [tuple(write) for write in cached] == _writes()
+
+    def test_evicts_least_recently_used_past_maxsize(self):
+        """Test the entry count never exceeds maxsize."""
+        cache = NodeResultCache(maxsize=2)
+        cache.set({(NS, "a"): (_writes(), 300)})
+        cache.set({(NS, "b"): (_writes(), 300)})
+        cache.get([(NS, "a")])  # "b" is now least recently used
+        cache.set({(NS, "c"): (_writes(), 300)})
+
+        assert len(cache) == 2
+        assert cache.get([(NS, "b")]) == {}
+        assert set(cache.get([(NS, "a"), (NS, "c")])) == {(NS, "a"), (NS, "c")}
+
+    def test_expired_entries_swept_on_write(self):
+        """Test expired keys are dropped even if never read again."""
+        cache = NodeResultCache()
+        with patch("core.node_cache.time.time", return_value=1000.0):
+            cache.set({(NS, "old"): (_writes(), 10)})
+        with patch("core.node_cache.time.time", return_value=2000.0):
+            cache.set({(NS, "new"): (_writes(), 10)})
+
+        assert len(cache) == 1
+
+    def test_error_and_fallback_results_not_stored(self):
+        """Test degraded analyses are not cached."""
+        cache = NodeResultCache()
+        cache.set({
+            (NS, "err"): (_writes("Error during sentiment analysis: boom"), 300),
+            (NS, "fb"): (_writes("Fallback analysis: FEAR sentiment detected"), 300),
+            (("vision_agent",), "v"): ([("vision_analysis", {}), ("error", "Vision analysis error")], 300),
+        })
+
+        assert len(cache) == 0
+
+    def test_unserializable_writes_skipped(self):
+        """Test values the serializer rejects are skipped, not raised."""
+        import numpy as np
+
+        cache = NodeResultCache()
+        cache.set({(NS, "np"): ([("technical_analysis", {"flag": np.bool_(True)})], 300)})
+
+        assert len(cache) == 0
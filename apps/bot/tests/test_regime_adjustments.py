@@ -188,6 +188,17 @@ class TestGetRegimeAdjustedThresholds:
         assert thresholds["fear_threshold_buy"] == 35
         assert thresholds["position_size_multiplier"] == 0.9
 
+    def test_override_skips_env_parsing(self, monkeypatch):
+        """Test overridden values never read or parse the env var."""
+        monkeypatch.setenv("REGIME_BEAR_FEAR_THRESHOLD", "not-a-number")
+
+        thresholds = get_regime_adjusted_thresholds(
+            MarketRegime.BEAR,
+            config={"bear_fear_threshold": 18},
+        )
+
+        assert thresholds["fear_threshold_buy"] == 18
+
 
 # =============================================================================
 # Test should_skip_trading
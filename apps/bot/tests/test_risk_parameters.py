@@ -123,6 +123,24 @@ class TestEnhancedRiskConfig:
             with pytest.raises(ValueError, match="Correlated exposure"):
                 config.validate()
 
+    def test_atr_settings_match_risk_config(self):
+        """Test both risk sections read the same ATR settings."""
+        from config import RiskConfig
+
+        with patch.dict('os.environ', {'RISK_ATR_PERIOD': '21', 'RISK_ATR_MULTIPLIER': '3.0'}):
+            enhanced = EnhancedRiskConfig()
+            basic = RiskConfig()
+
+        assert (enhanced.atr_period, enhanced.atr_multiplier) == (21, 3.0)
+        assert (basic.atr_period, basic.atr_multiplier) == (21, 3.0)
+
+    def test_config_validation_reports_bound_and_value(self):
+        """Test validation errors name the allowed range and the bad value."""
+        with patch.dict('os.environ', {'RISK_ALERT_THRESHOLD_PCT': '40.0'}):
+            config = EnhancedRiskConfig()
+            with pytest.raises(ValueError, match=r"Alert threshold must be 50-99%, got 40\.0"):
+                config.validate()
+
     def test_config_from_environment(self):
         """Test config reads from environment variables."""
         with patch.dict('os.environ', {
@@ -21,6 +21,7 @@ Test Coverage:
 - Fail-safe behaviors
 """
 
+import json
 import pytest
 from decimal import Decimal
 from datetime import datetime, timezone
@@ -555,6 +556,117 @@ class TestCheckDrawdown:
         assert current_value == 0.0
 
 
+# =============================================================================
+# Test get_safety_snapshot()
+# =============================================================================
+
+
+class TestGetSafetySnapshot:
+    """Tests for get_safety_snapshot function."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_combines_config_count_and_drawdown(
+        self, mock_session, sample_system_config
+    ):
+        """Test config row and open count come from one query."""
+        from services.safety import get_safety_snapshot
+
+        mock_result = MagicMock()
+        mock_result.first.return_value = (sample_system_config, 3)
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            "services.safety.get_portfolio_value",
+            new_callable=AsyncMock,
+            return_value=(9000.0, {}),
+        ):
+            snapshot = await get_safety_snapshot(session=mock_session)
+
+        assert mock_session.execute.await_count == 1
+        mock_session.commit.assert_not_awaited()
+        assert snapshot["status"] == SystemStatus.ACTIVE
+        assert snapshot["trading_enabled"] is True
+        assert snapshot["open_positions"] == 3
+        assert snapshot["current_value"] == 9000.0
+        assert snapshot["drawdown_pct"] == pytest.approx(0.10)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_fails_safe_without_config(self, mock_session):
+        """Test missing SystemConfig reports PAUSED with trading disabled."""
+        from services.safety import get_safety_snapshot
+
+        missing_result = MagicMock()
+        missing_result.first.return_value = None
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 0
+        mock_session.execute = AsyncMock(side_effect=[missing_result, count_result])
+
+        with patch(
+            "services.safety.get_portfolio_value",
+            new_callable=AsyncMock,
+            return_value=(9000.0, {}),
+        ):
+            snapshot = await get_safety_snapshot(session=mock_session)
+
+        assert snapshot["status"] == SystemStatus.PAUSED
+        assert snapshot["trading_enabled"] is False
+        assert snapshot["current_value"] == 0.0
+
+
+# =============================================================================
+# Test get_portfolio_value()
+# =============================================================================
+
+
+class TestGetPortfolioValue:
+    """Tests for portfolio valuation."""
+
+    @pytest.fixture
+    def mock_kraken(self):
+        client = MagicMock()
+        client.initialize = AsyncMock()
+        client.exchange = MagicMock()
+        client.exchange.fetch_balance = AsyncMock(return_value={
+            "info": {},
+            "total": {},
+            "ZUSD": {"total": 500.0},
+            "XXBT": {"total": 0.01},
+            "DUST": {"total": 0.0},
+        })
+        client.exchange.fetch_ticker = AsyncMock(return_value={"last": 50000.0})
+        with patch("services.safety.get_kraken_client", return_value=client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_iter_portfolio_value_yields_priced_rows(self, mock_kraken):
+        """Test holdings are yielded one currency at a time in USD."""
+        from services.safety import iter_portfolio_value
+
+        rows = [row async for row in iter_portfolio_value()]
+
+        assert rows == [("ZUSD", 500.0, 500.0), ("XXBT", 0.01, 500.0)]
+        mock_kraken.exchange.fetch_ticker.assert_awaited_once_with("BTC/USD")
+
+    @pytest.mark.asyncio
+    async def test_get_portfolio_value_totals_rows(self, mock_kraken):
+        """Test get_portfolio_value aggregates the streamed rows."""
+        from services.safety import get_portfolio_value
+
+        total, breakdown = await get_portfolio_value()
+
+        assert total == 1000.0
+        assert breakdown["XXBT"] == {"amount": 0.01, "value_usd": 500.0}
+
+    @pytest.mark.asyncio
+    async def test_get_portfolio_value_returns_zero_on_error(self, mock_kraken):
+        """Test balance fetch failures fall back to an empty portfolio."""
+        from services.safety import get_portfolio_value
+
+        mock_kraken.exchange.fetch_balance.side_effect = Exception("API down")
+
+        assert await get_portfolio_value() == (0.0, {})
+
+
 # =============================================================================
 # Test liquidate_all()
 # =============================================================================
@@ -959,3 +1071,258 @@ class TestSafetyIntegration:
         # Attempt resume should fail
         result = await resume_trading(session=mock_session)
         assert result is False
+
+
+# =============================================================================
+# Safety API Tests
+# =============================================================================
+
+
+class TestSafetyStatusEndpoint:
+    """Tests for GET /api/safety/status response caching."""
+
+    @pytest.fixture(autouse=True)
+    def reset_status_cache(self):
+        from api.routes.safety import invalidate_status_cache
+
+        invalidate_status_cache()
+        yield
+        invalidate_status_cache()
+
+    @staticmethod
+    def _request(headers=None):
+        request = MagicMock()
+        request.headers = headers or {}
+        return request
+
+    @pytest.fixture
+    def patched_services(self):
+        with patch("api.routes.safety.get_safety_snapshot", new_callable=AsyncMock) as snapshot:
+            snapshot.return_value = {
+                "status": SystemStatus.ACTIVE,
+                "trading_enabled": True,
+                "current_value": 9500.0,
+                "initial_balance": 10000.0,
+                "drawdown_pct": 0.05,
+                "max_drawdown_pct": 0.20,
+                "open_positions": 2,
+            }
+            yield {"snapshot": snapshot}
+
+    @pytest.mark.asyncio
+    async def test_status_is_cached_between_polls(self, patched_services):
+        """Test repeated polls within the TTL reuse the cached response."""
+        from api.routes.safety import get_status
+
+        first = await get_status(self._request())
+        second = await get_status(self._request())
+
+        assert first.body == second.body
+        assert first.media_type == "application/json"
+        assert json.loads(first.body)["open_positions"] == 2
+        assert patched_services["snapshot"].await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_not_modified(self, patched_services):
+        """Test If-None-Match with the current ETag short-circuits to 304."""
+        from api.routes.safety import get_status
+
+        first = await get_status(self._request())
+        etag = first.headers["etag"]
+
+        second = await get_status(self._request({"if-none-match": etag}))
+
+        assert second.status_code == 304
+        assert second.body == b""
+        assert second.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_pause_invalidates_status_cache(self, patched_services):
+        """Test pausing forces the next status poll to recompute."""
+        from api.routes.safety import get_status, pause_system
+
+        await get_status(self._request())
+
+        with patch("api.routes.safety.pause_trading", new_callable=AsyncMock) as pause:
+            pause.return_value = True
+            await pause_system(reason="Test pause")
+
+        patched_services["snapshot"].return_value["status"] = SystemStatus.PAUSED
+        result = await get_status(self._request())
+
+        assert json.loads(result.body)["status"] == SystemStatus.PAUSED.value
+        assert patched_services["snapshot"].await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_status_stream_emits_sse_event(self, patched_services):
+        """Test the status stream pushes the current status as an SSE event."""
+        from api.routes.safety import stream_status
+
+        mock_request = MagicMock()
+        mock_request.is_disconnected = AsyncMock(side_effect=[False, True])
+
+        response = await stream_status(mock_request, interval=1.0)
+        events = [event async for event in response.body_iterator]
+
+        assert response.media_type == "text/event-stream"
+        assert len(events) == 1
+        assert events[0].startswith(b"data: ")
+        assert b'"open_positions":2' in events[0]
+
+
+class TestLiquidationEndpoint:
+    """Tests for POST /api/safety/liquidate."""
+
+    @pytest.mark.asyncio
+    async def test_liquidate_requires_confirmation(self):
+        """Test liquidation is rejected without confirm=true."""
+        from fastapi import HTTPException
+        from api.routes.safety import emergency_liquidate
+
+        with pytest.raises(HTTPException) as exc_info:
+            await emergency_liquidate(reason="Test", confirm=False, stream=False)
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_concurrent_liquidation_is_rejected(self):
+        """Test a second liquidation request while one runs gets 429."""
+        from fastapi import HTTPException
+        from api.routes.safety import _exclusive
+
+        guard = _exclusive("liquidate-test")
+        first = guard()
+        await first.__anext__()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await guard().__anext__()
+        assert exc_info.value.status_code == 429
+
+        # Releasing the first request frees the action again
+        with pytest.raises(StopAsyncIteration):
+            await first.__anext__()
+        second = guard()
+        await second.__anext__()
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_liquidate_streams_progress_events(self):
+        """Test stream=true emits one SSE event per liquidation step."""
+        from api.routes.safety import emergency_liquidate
+
+        async def fake_stream(reason):
+            yield {"event": "started", "positions": 1}
+            yield {"event": "closed", "trade_id": "t1", "symbol": "SOLUSD", "pnl": 12.5}
+            yield {"event": "complete", "summary": {"positions_closed": 1}}
+
+        with patch("api.routes.safety.liquidate_all_stream", side_effect=fake_stream):
+            response = await emergency_liquidate(reason="Test", confirm=True, stream=True)
+            events = [event async for event in response.body_iterator]
+
+        assert response.media_type == "text/event-stream"
+        assert [e.split(b"\n", 1)[0] for e in events] == [
+            b"event: started",
+            b"event: closed",
+            b"event: complete",
+        ]
+        assert b'"pnl":12.5' in events[1]
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_streamed_liquidations(self):
+        """Test a second stream=true request is refused before the first streams."""
+        import asyncio
+
+        from fastapi import HTTPException
+        from api.routes.safety import _liquidation_tasks, emergency_liquidate
+
+        release = asyncio.Event()
+
+        async def slow_stream(reason):
+            yield {"event": "started", "positions": 1}
+            await release.wait()
+            yield {"event": "complete", "summary": {"positions_closed": 1}}
+
+        with patch("api.routes.safety.liquidate_all_stream", side_effect=slow_stream):
+            first = await emergency_liquidate(reason="First", confirm=True, stream=True)
+
+            with pytest.raises(HTTPException) as exc_info:
+                await emergency_liquidate(reason="Second", confirm=True, stream=True)
+            assert exc_info.value.status_code == 429
+
+            release.set()
+            events = [event async for event in first.body_iterator]
+
+        assert events[-1].startswith(b"event: complete")
+        await asyncio.sleep(0)
+        assert not _liquidation_tasks
+
+
+class TestSafetyApiModels:
+    """Tests for safety API request/response models."""
+
+    def test_init_request_rejects_unknown_fields(self):
+        """Test InitConfigRequest rejects misspelled fields instead of ignoring them."""
+        from pydantic import ValidationError
+        from api.routes.safety import InitConfigRequest
+
+        with pytest.raises(ValidationError):
+            InitConfigRequest(initial_balance=10000.0, max_drawdown=0.1)
+
+    def test_status_response_is_immutable(self):
+        """Test cached status responses cannot be mutated in place."""
+        from pydantic import ValidationError
+        from api.routes.safety import SystemStatusResponse
+
+        response = SystemStatusResponse(
+            status="ACTIVE",
+            trading_enabled=True,
+            current_value=10000.0,
+            initial_balance=10000.0,
+            drawdown_pct=0.0,
+            max_drawdown_pct=0.20,
+            open_positions=0,
+        )
+
+        with pytest.raises(ValidationError):
+            response.status = "PAUSED"
+
+
+class TestPortfolioEndpoint:
+    """Tests for GET /api/safety/portfolio streaming formats."""
+
+    @staticmethod
+    def _request(accept):
+        request = MagicMock()
+        request.headers = {"accept": accept}
+        return request
+
+    @staticmethod
+    async def _fake_rows():
+        yield "ZUSD", 500.0, 500.0
+        yield "XXBT", 0.01, 500.0
+
+    @pytest.mark.asyncio
+    async def test_ndjson_stream_emits_rows_then_total(self):
+        """Test NDJSON clients get one line per asset and a total line."""
+        from api.routes.safety import get_portfolio
+
+        with patch("api.routes.safety.iter_portfolio_value", side_effect=self._fake_rows):
+            response = await get_portfolio(self._request("application/x-ndjson"))
+            lines = [json.loads(chunk) async for chunk in response.body_iterator]
+
+        assert response.media_type == "application/x-ndjson"
+        assert [line.get("currency") for line in lines[:-1]] == ["ZUSD", "XXBT"]
+        assert lines[-1] == {"total_value_usd": 1000.0}
+
+    @pytest.mark.asyncio
+    async def test_msgpack_stream_emits_packed_records(self):
+        """Test MessagePack clients get concatenated packed records."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        from api.routes.safety import get_portfolio
+
+        with patch("api.routes.safety.iter_portfolio_value", side_effect=self._fake_rows):
+            response = await get_portfolio(self._request("application/msgpack"))
+            records = [ormsgpack.unpackb(chunk) async for chunk in response.body_iterator]
+
+        assert response.media_type == "application/msgpack"
+        assert records[-1] == {"total_value_usd": 1000.0}
@@ -77,26 +77,40 @@ class TestScaleConfig:
             assert scale_config.scale_timeout_hours == 72
 
     def test_get_scale_in_percentages(self):
-        """Test get_scale_in_percentages returns list of percentages."""
+        """Test get_scale_in_percentages returns a tuple of percentages."""
         import config as config_module
 
         scale_config = config_module.ScaleConfig()
         percentages = scale_config.get_scale_in_percentages()
 
-        assert isinstance(percentages, list)
+        assert isinstance(percentages, tuple)
         assert len(percentages) == 3
         assert percentages[0] == scale_config.scale_in_pct_1
         assert percentages[1] == scale_config.scale_in_pct_2
         assert percentages[2] == scale_config.scale_in_pct_3
 
+    def test_scale_tuples_are_computed_once(self):
+        """Test the scale getters return the same precomputed tuples."""
+        import config as config_module
+
+        scale_config = config_module.ScaleConfig()
+
+        assert scale_config.get_scale_in_percentages() is scale_config.get_scale_in_percentages()
+        assert scale_config.get_scale_in_drop_triggers() == (
+            0.0, scale_config.scale_in_drop_2, scale_config.scale_in_drop_3,
+        )
+        assert scale_config.get_scale_out_profit_triggers() == (
+            scale_config.scale_out_profit_1, scale_config.scale_out_profit_2, 0.0,
+        )
+
     def test_get_scale_out_percentages(self):
-        """Test get_scale_out_percentages returns list of percentages."""
+        """Test get_scale_out_percentages returns a tuple of percentages."""
         import config as config_module
 
         scale_config = config_module.ScaleConfig()
         percentages = scale_config.get_scale_out_percentages()
 
-        assert isinstance(percentages, list)
+        assert isinstance(percentages, tuple)
         assert len(percentages) == 3
         assert abs(sum(percentages) - 100.0) < 0.1
 
@@ -126,10 +140,11 @@ class TestScaleConfig:
         """Test ScaleConfig validate() fails when percentages don't sum to 100."""
         import config as config_module
 
-        scale_config = config_module.ScaleConfig()
-        scale_config.scale_in_pct_1 = 50.0
-        scale_config.scale_in_pct_2 = 50.0
-        scale_config.scale_in_pct_3 = 50.0  # Sum = 150
+        scale_config = config_module.ScaleConfig(
+            scale_in_pct_1=50.0,
+            scale_in_pct_2=50.0,
+            scale_in_pct_3=50.0,  # Sum = 150
+        )
 
         with pytest.raises(ValueError, match="must sum to 100"):
             scale_config.validate()
@@ -138,9 +153,10 @@ class TestScaleConfig:
         """Test ScaleConfig validate() fails with invalid trigger order."""
         import config as config_module
 
-        scale_config = config_module.ScaleConfig()
-        scale_config.scale_in_drop_2 = 15.0
-        scale_config.scale_in_drop_3 = 10.0  # Should be greater than drop_2
+        scale_config = config_module.ScaleConfig(
+            scale_in_drop_2=15.0,
+            scale_in_drop_3=10.0,  # Should be greater than drop_2
+        )
 
         with pytest.raises(ValueError, match="must be greater than"):
             scale_config.validate()
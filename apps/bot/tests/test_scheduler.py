@@ -6,7 +6,7 @@ active assets fetching, and candle upsert logic.
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -145,6 +145,63 @@ class TestUpsertCandle:
         assert result is False
 
 
+class TestUpsertCandles:
+    """Tests for the batched upsert_candles function."""
+
+    @staticmethod
+    def _candle(minutes: int) -> dict:
+        return {
+            "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes),
+            "timeframe": "15m",
+            "open": Decimal("42000.00"),
+            "high": Decimal("42500.00"),
+            "low": Decimal("41500.00"),
+            "close": Decimal("42100.00"),
+            "volume": Decimal("100.50"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_upsert_candles_single_statement(self):
+        """Test a batch of candles is written with one execute call."""
+        from services.scheduler import upsert_candles
+
+        candles = [self._candle(15 * i) for i in range(200)]
+
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock()
+
+        count = await upsert_candles(mock_session, "asset-123", candles)
+
+        assert count == 200
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upsert_candles_deduplicates(self):
+        """Test duplicate (timestamp, timeframe) rows are collapsed."""
+        from services.scheduler import upsert_candles
+
+        candles = [self._candle(0), self._candle(0), self._candle(15)]
+
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock()
+
+        count = await upsert_candles(mock_session, "asset-123", candles)
+
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_candles_handles_error(self):
+        """Test upsert_candles returns 0 on database errors."""
+        from services.scheduler import upsert_candles
+
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=Exception("DB Error"))
+
+        count = await upsert_candles(mock_session, "asset-123", [self._candle(0)])
+
+        assert count == 0
+
+
 class TestUpdateAssetPrice:
     """Tests for update_asset_price function."""
 
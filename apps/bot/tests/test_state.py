@@ -376,3 +376,27 @@ class TestCreateInitialState:
         # Output fields should be None
         assert state["technical_analysis"] is None
         assert state["final_decision"] is None
+
+
+class TestToBuiltin:
+    """Tests for to_builtin."""
+
+    def test_numpy_values_become_builtins(self):
+        """Test nested numpy scalars are converted to plain Python types."""
+        import numpy as np
+
+        from core.state import to_builtin
+
+        result = to_builtin({
+            "rsi": np.float64(41.5),
+            "bollinger": {"is_squeeze": np.bool_(True), "bands": [np.float64(1.0)]},
+            "signal": "BULLISH",
+        })
+
+        assert result == {
+            "rsi": 41.5,
+            "bollinger": {"is_squeeze": True, "bands": [1.0]},
+            "signal": "BULLISH",
+        }
+        assert type(result["rsi"]) is float
+        assert type(result["bollinger"]["is_squeeze"]) is bool
@@ -515,6 +515,18 @@ class TestComprehensiveAnalysis:
         assert analysis.adx is not None
         assert analysis.vwap is not None
 
+    def test_indicators_accept_prebuilt_frame(self, uptrend_candles):
+        """Test a shared column frame gives the same results as the raw list."""
+        import pandas as pd
+
+        df = pd.DataFrame(uptrend_candles)
+        before = df.copy()
+
+        assert calculate_vwap(df).value == calculate_vwap(uptrend_candles).value
+        assert calculate_macd(df).value == calculate_macd(uptrend_candles).value
+        # VWAP re-indexes a copy; the shared frame must not be mutated
+        pd.testing.assert_frame_equal(df, before)
+
     def test_comprehensive_analysis_includes_rsi(self, uptrend_candles):
         """Test comprehensive analysis includes RSI value."""
         analysis = analyze_all_indicators(uptrend_candles)
@@ -564,7 +564,8 @@ class TradingDashboard:
 
     def create_header(self) -> Panel:
         """Create header panel"""
-        sandbox_mode = os.getenv("KRAKEN_SANDBOX_MODE", "true").lower() == "true"
+        from config import get_config
+        sandbox_mode = get_config().kraken.sandbox_mode
 
         header = Text()
         header.append("◆ ", style="cyan")